@@ -0,0 +1,135 @@
+"""SVG vs matplotlib for the simple line diagrams (mathbook.diagrams).
+
+    python benchmarks/diagrams.py              # render time and payload per diagram
+    python benchmarks/diagrams.py --pages      # also page rerun time with each backend
+    python benchmarks/diagrams.py --json       # machine-readable output
+
+The matplotlib side does what st.pyplot does: draw onto a pooled figure
+and save a tight PNG at 200 dpi. The SVG side builds the Diagram and
+serializes it. ``--pages`` reruns the pages that use diagrams through
+AppTest with MATHBOOK_DIAGRAMS set to each backend in turn.
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("MATHBOOK_WARM_FRAMES", "0")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from mathbook import config  # noqa: E402
+from mathbook.diagrams import Diagram  # noqa: E402
+from mathbook import right_triangle  # noqa: E402
+from pages import trig_spinner_sketcher  # noqa: E402
+
+DIAGRAMS = {
+    "clinometer": lambda: right_triangle.diagram(30.0, 10.0),
+    "vr_tower": lambda: right_triangle.diagram(30.0, 10.0, labels=('Distance', 'Height', None)),
+    "spinner": lambda: trig_spinner_sketcher._diagram(135),
+    "triangle": lambda: Diagram((-1, 6), (-1, 4), equal=True).polygon([[0, 0], [5, 0], [2.5, 3]], 'lightgreen', fill='lightgreen'),
+}
+
+# Page, then the number_input to nudge between reruns
+PAGES = [
+    ("trig_clinometer", "show_trig_clinometer", "clino_angle"),
+    ("trig_vr_environments", "show_trig_vr_environments", None),
+    ("geometry", "show_geometry_page", None),
+]
+
+
+def _time(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def _svg(make):
+    return make().to_svg().encode("utf-8")
+
+
+def _png(make):
+    from mathbook.figures import subplots
+
+    with subplots() as (fig, ax):
+        make().draw(ax)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    return buf.getvalue()
+
+
+def bench_diagrams(repeat):
+    results = {}
+    for name, make in DIAGRAMS.items():
+        _png(make)  # first figure pays for font and backend setup
+        svg_ms, svg = _time(lambda: _svg(make), repeat)
+        png_ms, png = _time(lambda: _png(make), max(3, repeat // 20))
+        results[name] = {"svg_ms": svg_ms, "svg_bytes": len(svg), "matplotlib_ms": png_ms, "png_bytes": len(png)}
+    return results
+
+
+def _page_app(module, function):
+    import importlib
+
+    getattr(importlib.import_module(f"pages.{module}"), function)()
+
+
+def bench_pages(reruns):
+    from streamlit.testing.v1 import AppTest
+
+    from mathbook.render_pool import get_render_pool
+
+    # Geometry draws through the render pool; its workers import __main__,
+    # which has to be this script rather than an AppTest one
+    get_render_pool().start()
+    results = {}
+    for module, function, key in PAGES:
+        for backend in ("svg", "matplotlib"):
+            config.DIAGRAM_BACKEND = backend
+            at = AppTest.from_function(_page_app, args=(module, function), default_timeout=60).run()
+            samples = []
+            for i in range(reruns):
+                if key:
+                    at.number_input(key=key).set_value(20.0 + i % 40)
+                start = time.perf_counter()
+                at.run()
+                samples.append((time.perf_counter() - start) * 1000)
+                if at.exception:
+                    raise RuntimeError(f"{module} ({backend}): {at.exception[0].message}")
+            results.setdefault(module, {})[f"{backend}_rerun_ms"] = statistics.median(samples)
+    config.DIAGRAM_BACKEND = "svg"
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="SVG renders per diagram (matplotlib gets 1/20 of that)")
+    parser.add_argument("--pages", action="store_true", help="also time page reruns under AppTest with each backend")
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    report = {"diagrams": bench_diagrams(args.repeat)}
+    if args.pages:
+        report["pages"] = bench_pages(args.reruns)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for name, r in report["diagrams"].items():
+        print(f"{name:12s} svg {r['svg_ms']:7.3f} ms {r['svg_bytes'] / 1024:6.1f} KB | "
+              f"matplotlib {r['matplotlib_ms']:7.1f} ms {r['png_bytes'] / 1024:6.1f} KB | "
+              f"{r['matplotlib_ms'] / r['svg_ms']:6.0f}x")
+    for module, r in report.get("pages", {}).items():
+        print(f"{module:22s} rerun svg {r['svg_rerun_ms']:7.1f} ms | matplotlib {r['matplotlib_rerun_ms']:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""Concurrent-session load test against one Streamlit server process.
+
+    python benchmarks/load_test.py                            # 1, 2, 4, 8, 16 sessions on app.py
+    python benchmarks/load_test.py --sessions 10,20,40 --duration 60
+    python benchmarks/load_test.py --url http://localhost:8501 # an already running server
+
+Starts ``streamlit run app.py`` (unless --url is given) and drives it the
+way browsers do: each simulated student holds a websocket to
+/_stcore/stream, sends rerun requests with widget states, waits for the
+script to finish and fetches the images it produced. Students pause for a
+random think time, then click a sidebar page or move a slider/selectbox
+on the current page. Sessions are spread over a pool of client processes
+so the load generator itself is not what saturates.
+
+For every session count the report gives p50/p95/p99 rerun latency
+(request sent to script finished), reruns per second, and the server's
+peak RSS and CPU use; "RSS/session" is the growth over the idle server
+divided by the number of sessions.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sidebar buttons in app.py that switch pages
+NAV_KEYS = ("trig_", "category_")
+
+
+class Session:
+    """One simulated browser tab."""
+
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.widget_states = {}
+        self.nav_buttons = []
+        self.controls = []
+        self.media = []
+        self.errors = []
+
+    async def connect(self):
+        from tornado.websocket import websocket_connect
+
+        ws_url = self.url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.ws = await websocket_connect(ws_url, subprotocols=["streamlit"], max_message_size=256 * 1024 * 1024)
+
+    async def rerun(self, trigger=None):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.SetInParent()
+        states = msg.rerun_script.widget_states.widgets
+        for state in self.widget_states.values():
+            states.add().CopyFrom(state)
+        if trigger is not None:
+            states.add(id=trigger, trigger_value=True)
+
+        self.nav_buttons, self.controls, self.media, self.errors = [], [], [], []
+        start = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        while True:
+            payload = await self.ws.read_message()
+            if payload is None:
+                raise ConnectionError("server closed the websocket")
+            fwd = ForwardMsg()
+            fwd.ParseFromString(payload)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                self._collect(fwd.delta.new_element, fwd.metadata.delta_path[0] == 1)
+            elif kind == "script_finished" and fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                latency = (time.perf_counter() - start) * 1000
+                # Like the frontend, only send states for widgets still on screen
+                shown = {widget.id for _, widget in self.controls}
+                self.widget_states = {k: v for k, v in self.widget_states.items() if k in shown}
+                return latency
+
+    def _collect(self, element, in_sidebar):
+        kind = element.WhichOneof("type")
+        if kind == "button" and in_sidebar and element.button.id.rsplit("-", 1)[-1].startswith(NAV_KEYS):
+            self.nav_buttons.append(element.button.id)
+        elif kind in ("slider", "selectbox", "radio"):
+            self.controls.append((kind, getattr(element, kind)))
+        elif kind == "imgs":
+            self.media.extend(img.url for img in element.imgs.imgs)
+        elif kind == "exception":
+            self.errors.append(element.exception.message)
+
+    def next_action(self):
+        # Returns the trigger id for a page switch, or None after changing a control
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        if self.nav_buttons and (not self.controls or self.rng.random() < 0.3):
+            return self.rng.choice(self.nav_buttons)
+        kind, widget = self.rng.choice(self.controls)
+        if kind == "slider":
+            steps = int(round((widget.max - widget.min) / widget.step))
+            value = widget.min + self.rng.randint(0, steps) * widget.step
+            state = WidgetState(id=widget.id)
+            state.double_array_value.data.append(value)
+        else:
+            state = WidgetState(id=widget.id, int_value=self.rng.randrange(len(widget.options)))
+        self.widget_states[widget.id] = state
+        return None
+
+    async def fetch_media(self, client):
+        received = 0
+        for url in self.media:
+            response = await client.fetch(self.url + url, raise_error=False)
+            received += len(response.body or b"")
+        return received
+
+
+async def _simulate(url, count, duration, think, seed):
+    from tornado.httpclient import AsyncHTTPClient
+
+    client = AsyncHTTPClient(max_clients=max(10, count))
+    latencies, errors, media_bytes = [], [], 0
+    deadline = time.perf_counter() + duration
+
+    async def student(i):
+        nonlocal media_bytes
+        session = Session(url, random.Random(seed * 1000 + i))
+        # Stagger arrivals over one think time
+        await asyncio.sleep(session.rng.uniform(0, think))
+        await session.connect()
+        trigger = None
+        while time.perf_counter() < deadline:
+            latency = await session.rerun(trigger)
+            if time.perf_counter() < deadline:
+                latencies.append(latency)
+            errors.extend(session.errors)
+            media_bytes += await session.fetch_media(client)
+            await asyncio.sleep(session.rng.expovariate(1 / think) if think else 0)
+            trigger = session.next_action()
+        session.ws.close()
+
+    await asyncio.gather(*(student(i) for i in range(count)))
+    return {"latencies_ms": latencies, "errors": errors, "media_bytes": media_bytes}
+
+
+def run_clients(url, count, duration, think, seed):
+    return asyncio.run(_simulate(url, count, duration, think, seed))
+
+
+def _proc_stats(pid):
+    # (RSS in bytes, CPU seconds) of a Linux process, from /proc
+    with open(f"/proc/{pid}/status") as f:
+        rss = next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmRSS:"))
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    return rss, cpu
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(script, port):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script,
+         "--server.headless", "true", "--server.port", str(port), "--server.address", "127.0.0.1",
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    from urllib.request import urlopen
+
+    for _ in range(300):
+        try:
+            with urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return server
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError(f"streamlit exited with code {server.returncode}")
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("streamlit did not become healthy within 30 s")
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return float("nan")
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def run_level(pool, url, sessions, workers, duration, think, pid):
+    per_worker = [sessions // workers + (i < sessions % workers) for i in range(workers)]
+    futures = [pool.submit(run_clients, url, n, duration, think, seed=i) for i, n in enumerate(per_worker) if n]
+
+    peak_rss, cpu_start, wall_start = 0, None, time.perf_counter()
+    if pid:
+        cpu_start = _proc_stats(pid)[1]
+    while not all(f.done() for f in futures):
+        if pid:
+            peak_rss = max(peak_rss, _proc_stats(pid)[0])
+        time.sleep(0.25)
+    wall = time.perf_counter() - wall_start
+
+    latencies, errors, media_bytes = [], [], 0
+    for future in futures:
+        result = future.result()
+        latencies += result["latencies_ms"]
+        errors += result["errors"]
+        media_bytes += result["media_bytes"]
+    latencies.sort()
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "throughput_rps": len(latencies) / duration,
+        "p50_ms": _percentile(latencies, 0.50),
+        "p95_ms": _percentile(latencies, 0.95),
+        "p99_ms": _percentile(latencies, 0.99),
+        "mean_ms": statistics.fmean(latencies) if latencies else float("nan"),
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "media_mb": media_bytes / 2**20,
+        "server_peak_rss_mb": peak_rss / 2**20 if pid else None,
+        "server_cpu_pct": 100 * (_proc_stats(pid)[1] - cpu_start) / wall if pid else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--script", default="app.py", help="entry point to serve (default app.py)")
+    parser.add_argument("--url", help="drive an already running server instead of starting one")
+    parser.add_argument("--sessions", default="1,2,4,8,16", help="comma-separated session counts (default 1,2,4,8,16)")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per session count (default 30)")
+    parser.add_argument("--think", type=float, default=1.0, help="mean think time between interactions, seconds (default 1)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="client processes (default: CPU count)")
+    parser.add_argument("--json", dest="json_path", help="also write the results here")
+    args = parser.parse_args(argv)
+
+    server = None
+    url, pid = args.url, None
+    if url is None:
+        port = _free_port()
+        server = start_server(args.script, port)
+        url, pid = f"http://127.0.0.1:{port}", server.pid
+    url = url.rstrip("/")
+
+    results = []
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            # One student visits the app first so imports and caches are warm
+            pool.submit(run_clients, url, 1, min(10.0, args.duration), 0.0, seed=99).result()
+            idle_rss = _proc_stats(pid)[0] / 2**20 if pid else None
+
+            print(f"{'sessions':>8} {'reruns':>7} {'rerun/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+                  f"{'errors':>6} {'cpu %':>6} {'rss MB':>7} {'MB/sess':>8}")
+            for sessions in (int(n) for n in args.sessions.split(",")):
+                workers = max(1, min(args.workers, sessions))
+                result = run_level(pool, url, sessions, workers, args.duration, args.think, pid)
+                if pid:
+                    result["server_rss_per_session_mb"] = (result["server_peak_rss_mb"] - idle_rss) / sessions
+                results.append(result)
+                print(f"{sessions:8d} {result['reruns']:7d} {result['throughput_rps']:8.1f} {result['p50_ms']:8.1f} "
+                      f"{result['p95_ms']:8.1f} {result['p99_ms']:8.1f} {result['errors']:6d} "
+                      + (f"{result['server_cpu_pct']:6.0f} {result['server_peak_rss_mb']:7.1f} "
+                         f"{result['server_rss_per_session_mb']:8.2f}" if pid else f"{'-':>6} {'-':>7} {'-':>8}"))
+                if result["first_error"]:
+                    print(f"         first error: {result['first_error']}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"url": url, "idle_rss_mb": idle_rss, "levels": results}, f, indent=2)
+    return 1 if any(r["errors"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Per-page rerun latency benchmarks driven by Streamlit's headless AppTest.
+
+    python benchmarks/run.py                   # run, compare with baselines.json
+    python benchmarks/run.py -k encyclopedia   # only scenarios matching a substring
+    python benchmarks/run.py --update          # record the results as the new baselines
+
+Every scenario is replayed twice: once for wall and CPU time per rerun,
+and once under tracemalloc for peak Python memory per rerun (tracemalloc
+slows the interpreter, so the two are kept apart). Exits non-zero when a
+scenario's median wall time or peak memory regresses past the tolerance.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINES = os.path.join(ROOT, "benchmarks", "baselines.json")
+
+# Warm-up workers would compete for CPU with the reruns being timed
+os.environ.setdefault("MATHBOOK_WARM_FRAMES", "0")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from benchmarks import scenarios  # noqa: E402
+
+# Differences smaller than these are noise, whatever the ratio
+MIN_WALL_MS = 5.0
+MIN_PEAK_KB = 256.0
+
+
+def _make_upload(directory):
+    import numpy as np
+    from PIL import Image
+
+    # A 12 MP phone-sized photo: smooth gradients compress like a real one
+    y, x = np.mgrid[0:3000, 0:4000]
+    pixels = np.stack([x * 255 // 4000, y * 255 // 3000, (x + y) * 255 // 7000], axis=-1).astype("uint8")
+    path = os.path.join(directory, "upload.jpg")
+    Image.fromarray(pixels).save(path, quality=90)
+    return path
+
+
+def _replay(scenario, measure_memory):
+    at = scenario.make()
+    samples = []
+    for name, step in [("load", None)] + [(f"step{i}", s) for i, s in enumerate(scenario.steps)]:
+        if step is not None:
+            step(at)
+        if measure_memory:
+            tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+        at.run()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if at.exception:
+            raise RuntimeError(f"{scenario.name} {name}: {at.exception[0].message}")
+        sample = {"step": name, "wall_ms": wall * 1000, "cpu_ms": cpu * 1000}
+        if measure_memory:
+            sample["peak_kb"] = tracemalloc.get_traced_memory()[1] / 1024
+        samples.append(sample)
+    return samples
+
+
+def run_scenario(scenario):
+    timings = _replay(scenario, measure_memory=False)
+    tracemalloc.start()
+    try:
+        memory = _replay(scenario, measure_memory=True)
+    finally:
+        tracemalloc.stop()
+    for timing, mem in zip(timings, memory):
+        timing["peak_kb"] = mem["peak_kb"]
+
+    # The first load pays for imports and cold caches; report it apart
+    reruns = timings[1:] or timings
+    walls = sorted(s["wall_ms"] for s in reruns)
+    return {
+        "load_wall_ms": timings[0]["wall_ms"],
+        "reruns": len(reruns),
+        "median_wall_ms": statistics.median(walls),
+        "p95_wall_ms": walls[min(len(walls) - 1, int(0.95 * len(walls)))],
+        "median_cpu_ms": statistics.median(s["cpu_ms"] for s in reruns),
+        "max_peak_kb": max(s["peak_kb"] for s in reruns),
+        "samples": timings,
+    }
+
+
+def compare(results, baselines, tolerance):
+    regressions = []
+    for name, result in results.items():
+        base = baselines.get(name)
+        if base is None:
+            continue
+        for metric, floor in (("median_wall_ms", MIN_WALL_MS), ("max_peak_kb", MIN_PEAK_KB)):
+            limit = base[metric] * (1 + tolerance)
+            if result[metric] > limit and result[metric] - base[metric] > floor:
+                regressions.append(f"{name}: {metric} {result[metric]:.1f} > baseline {base[metric]:.1f} (+{tolerance:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="match", default="", help="only run scenarios whose name contains this")
+    parser.add_argument("--update", action="store_true", help="write results to baselines.json")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown ratio (default 0.25)")
+    parser.add_argument("--json", dest="json_path", help="also write full per-rerun samples here")
+    args = parser.parse_args(argv)
+
+    # Render-pool workers import __main__ when they start, which has to be
+    # this script rather than one of the AppTest scripts below
+    from mathbook.render_pool import get_render_pool
+    get_render_pool().start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        selected = [s for s in scenarios.build(_make_upload(tmp)) if args.match in s.name]
+        results = {}
+        for scenario in selected:
+            results[scenario.name] = result = run_scenario(scenario)
+            print(f"{scenario.name:40s} load {result['load_wall_ms']:8.1f} ms | "
+                  f"rerun median {result['median_wall_ms']:7.1f} ms p95 {result['p95_wall_ms']:7.1f} ms "
+                  f"cpu {result['median_cpu_ms']:7.1f} ms | peak {result['max_peak_kb'] / 1024:6.1f} MB")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    summary = {name: {k: round(v, 1) for k, v in r.items() if k != "samples"} for name, r in results.items()}
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES) as f:
+            baselines = json.load(f)
+
+    if args.update:
+        baselines.update(summary)
+        with open(BASELINES, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baselines written to {os.path.relpath(BASELINES)}")
+        return 0
+
+    regressions = compare(summary, baselines, args.tolerance)
+    for line in regressions:
+        print("REGRESSION", line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Scripted interactions replayed by benchmarks/run.py.
+
+A scenario is a name, a factory returning a fresh AppTest, and a list of
+steps. Each step mutates widgets on the AppTest and is followed by one
+timed rerun; the initial run is timed as step "load".
+"""
+from dataclasses import dataclass, field
+
+from streamlit.testing.v1 import AppTest
+
+TIMEOUT = 120
+
+
+@dataclass
+class Scenario:
+    name: str
+    make: object
+    steps: list = field(default_factory=list)
+
+
+def _page_app(page_id, upload_path=None):
+    # Runs as its own script inside AppTest, so imports live in here
+    import contextlib
+    import os
+    from unittest import mock
+
+    import streamlit as st
+    from streamlit.proto.Common_pb2 import FileURLs
+    from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+
+    from mathbook.registry import PAGES_BY_ID
+
+    patch = contextlib.nullcontext()
+    if upload_path:
+        # AppTest can't drive st.file_uploader; hand this page (and only this
+        # run of it) a file instead
+        with open(upload_path, "rb") as f:
+            record = UploadedFileRec("benchmark", os.path.basename(upload_path), "application/octet-stream", f.read())
+        patch = mock.patch.object(st, "file_uploader", lambda *args, **kwargs: UploadedFile(record, FileURLs()))
+    with patch:
+        PAGES_BY_ID[page_id].show()
+
+
+def page(page_id, upload_path=None):
+    return lambda: AppTest.from_function(
+        _page_app, default_timeout=TIMEOUT, kwargs=dict(page_id=page_id, upload_path=upload_path)
+    )
+
+
+def script(path):
+    return lambda: AppTest.from_file(path, default_timeout=TIMEOUT)
+
+
+def click(key, sidebar=True):
+    def step(at):
+        (at.sidebar if sidebar else at).button(key=key).click()
+    return step
+
+
+def set_slider(key, value):
+    return lambda at: at.slider(key=key).set_value(value)
+
+
+def set_number(label, value):
+    def step(at):
+        next(w for w in at.number_input if w.label == label).set_value(value)
+    return step
+
+
+def select(label, value):
+    def step(at):
+        next(w for w in at.selectbox if w.label == label).select(value)
+    return step
+
+
+def press(label):
+    def step(at):
+        next(w for w in at.button if w.label == label).click()
+    return step
+
+
+def build(upload_path):
+    from mathbook.registry import APP_PAGES, PAGES, SINGLEPAGE_PAGES
+
+    scenarios = [
+        Scenario("app.navigate", script("app.py"), [
+            click(f"trig_{p.id.replace(' ', '_')}") if p.category == "Trigonometry" else click("category_geometry")
+            for p in APP_PAGES
+        ] + [click("category_home")]),
+        Scenario("app_singlepage.navigate", script("app_singlepage.py"), [
+            click(p.id) for p in SINGLEPAGE_PAGES
+        ]),
+    ]
+
+    # Plain load of every show_* function
+    scenarios += [Scenario(f"page.{p.id}", page(p.id)) for p in PAGES if p.id != "Story Creator"]
+
+    scenarios += [
+        Scenario("encyclopedia.rt_angle_sweep", page("Encyclopedia"), [
+            set_slider("rt_angle", angle) for angle in range(1, 90, 8)
+        ]),
+        Scenario("encyclopedia.uc_angle_sweep", page("Encyclopedia"), [
+            set_slider("uc_angle", angle) for angle in range(0, 361, 30)
+        ]),
+        Scenario("calculator.inputs", page("Trig Calculator"), [
+            set_number("Enter angle in degrees", angle) for angle in (30.0, 45.0, 60.0, 90.0)
+        ] + [
+            select("Choose Calculation Type", "Inverse Trig Functions"),
+            set_number("Enter value (-1 to 1 for sin/cos, any for tan)", 0.5),
+            select("Choose Calculation Type", "Triangle Solver"),
+            set_number("Side A (opposite to angle A)", 3.0),
+            set_number("Side B (adjacent to angle A)", 4.0),
+        ]),
+        Scenario("ar_unit_circle.sweep", page("AR Unit Circle"), [
+            set_slider("ar_angle", angle) for angle in range(0, 361, 30)
+        ]),
+        Scenario("radian_crafts.sectors", page("Radian Crafts"), [
+            set_slider("craft_sectors", n) for n in range(1, 13)
+        ]),
+        Scenario("motion_waves.sweep", page("Motion & Waves"), [
+            set_slider("motion_angle", angle) for angle in range(0, 91, 15)
+        ]),
+        Scenario("story_creator.upload", page("Story Creator", upload_path), [
+            set_number("Angle of triangle (degrees)", angle) for angle in (20.0, 35.0, 50.0)
+        ] + [press("Generate Story PDF")]),
+    ]
+    return scenarios
@@ -0,0 +1,75 @@
+"""Additive tone synthesis streamed in fixed-size chunks, encoded to WAV.
+
+A tone is the sum of the first ``harmonics`` multiples of ``freq`` with
+amplitudes 1/k (harmonics at or above Nyquist are dropped). Samples are
+produced chunk by chunk from a running phase per harmonic, so chunk
+boundaries are seamless and a long tone never needs its whole float
+signal, or the harmonics × samples matrix, in memory at once.
+"""
+import io
+import wave
+
+import numpy as np
+
+SAMPLE_RATE = 22050
+CHUNK = 4096
+RING_SLOTS = 4
+# Linear fade at both ends so playback doesn't start or stop with a click
+FADE_S = 0.01
+AMPLITUDE = 0.8
+
+
+def _harmonics(freq, harmonics, sample_rate):
+    k = np.arange(1, harmonics + 1)
+    k = k[k * freq < sample_rate / 2]
+    weights = (1 / k) / np.sum(1 / k)
+    return k, weights
+
+
+def waveform(t, freq, harmonics=1):
+    """The normalised tone at times ``t`` (seconds), e.g. for plotting."""
+    k, weights = _harmonics(freq, harmonics, SAMPLE_RATE)
+    t = np.asarray(t, dtype=np.float64)
+    return np.tensordot(weights, np.sin(2 * np.pi * freq * np.multiply.outer(k, t)), axes=1)
+
+
+def synth_chunks(freq, duration, harmonics=1, sample_rate=SAMPLE_RATE, chunk_size=CHUNK, ring_slots=RING_SLOTS):
+    """Yield the tone as int16 chunks of up to ``chunk_size`` samples.
+
+    Chunks are views into a ring of ``ring_slots`` preallocated buffers:
+    one stays valid until ``ring_slots`` more have been yielded, so write
+    it out (or copy it) before then.
+    """
+    total = int(round(duration * sample_rate))
+    k, weights = _harmonics(freq, harmonics, sample_rate)
+    weights = weights * AMPLITUDE * 32767
+    omega = 2 * np.pi * freq * k / sample_rate
+    phase = np.zeros(len(k))
+    offsets = np.arange(chunk_size)
+    fade = max(1, int(FADE_S * sample_rate))
+    ring = np.empty((ring_slots, chunk_size), dtype=np.int16)
+
+    for i, start in enumerate(range(0, total, chunk_size)):
+        n = min(chunk_size, total - start)
+        # All harmonics of the chunk in one (harmonics × n) evaluation
+        samples = weights @ np.sin(phase[:, None] + omega[:, None] * offsets[:n])
+        index = start + offsets[:n]
+        samples *= np.clip(np.minimum(index, total - 1 - index) / fade, 0, 1)
+        # Wrap so the phase stays exact however long the tone runs
+        phase = (phase + omega * n) % (2 * np.pi)
+        out = ring[i % ring_slots, :n]
+        np.rint(samples, out=samples)
+        out[:] = samples
+        yield out
+
+
+def tone_wav(freq, duration, harmonics=1, sample_rate=SAMPLE_RATE):
+    """A mono 16-bit WAV of the tone, ready for st.audio."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        for chunk in synth_chunks(freq, duration, harmonics, sample_rate):
+            wav.writeframes(chunk.astype("<i2", copy=False).tobytes())
+    return buf.getvalue()
@@ -0,0 +1,118 @@
+import io
+from itertools import islice
+
+import numpy as np
+
+CHUNK_ROWS = 100_000
+PREVIEW_ROWS = 20
+
+ANGLES = "Angles (degrees) → sin, cos, tan"
+RATIOS = "Ratios → arcsin, arccos, arctan (degrees)"
+
+COLUMNS = {
+    ANGLES: ["angle_deg", "sin", "cos", "tan", "flag"],
+    RATIOS: ["value", "arcsin_deg", "arccos_deg", "arctan_deg", "flag"],
+}
+
+# cos(θ) smaller than this is treated as an asymptote of tan
+_TAN_EPS = 1e-12
+
+
+def parse_column(fields):
+    """Floats for a column of CSV fields; fields that are not numbers become NaN."""
+    raw = np.asarray(fields)
+    try:
+        return raw.astype(np.float64)
+    except ValueError:
+        # Slow path only for chunks that contain junk rows
+        values = np.empty(len(fields))
+        for i, field in enumerate(fields):
+            try:
+                values[i] = float(field)
+            except ValueError:
+                values[i] = np.nan
+        return values
+
+
+def _compute(mode, values):
+    flags = np.full(values.shape, "", dtype=object)
+    bad = ~np.isfinite(values)
+    flags[bad] = "not a number"
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if mode == ANGLES:
+            rad = np.radians(values)
+            sin = np.sin(rad)
+            cos = np.cos(rad)
+            undefined = ~bad & (np.abs(cos) < _TAN_EPS)
+            tan = np.where(undefined, np.nan, np.tan(rad))
+            flags[undefined] = "tan undefined"
+            return [sin, cos, tan], flags
+
+        outside = ~bad & (np.abs(values) > 1)
+        clipped = np.where(outside, np.nan, values)
+        flags[outside] = "outside [-1, 1] for arcsin/arccos"
+        return [
+            np.degrees(np.arcsin(clipped)),
+            np.degrees(np.arccos(clipped)),
+            np.degrees(np.arctan(values)),
+        ], flags
+
+
+def format_column(column):
+    """CSV fields for a column of floats, to 6 decimals; NaN becomes an empty field."""
+    # + 0.0 turns -0.0 into 0.0
+    text = (np.round(column, 6) + 0.0).astype(str)
+    text[np.isnan(column)] = ""
+    return text
+
+
+def _iter_chunks(stream):
+    fields = (line.split(",", 1)[0].strip().strip('"') for line in stream)
+    fields = (field for field in fields if field)
+    while True:
+        chunk = list(islice(fields, CHUNK_ROWS))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(mode, data):
+    """Compute a whole column of angles or ratios, chunk by chunk.
+
+    ``data`` is the uploaded CSV as bytes or pasted text; only the first
+    column is read and a non-numeric first line is taken as a header.
+    Returns the result CSV as bytes plus row counts and a small preview.
+    Bad rows are flagged in the ``flag`` column instead of failing the batch.
+    """
+    if isinstance(data, bytes):
+        stream = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="replace")
+    else:
+        stream = io.StringIO(data)
+
+    out = io.BytesIO()
+    out.write((",".join(COLUMNS[mode]) + "\n").encode("utf-8"))
+    rows = flagged = 0
+    preview = None
+    first = True
+    for chunk in _iter_chunks(stream):
+        if first:
+            first = False
+            try:
+                float(chunk[0])
+            except ValueError:
+                chunk = chunk[1:]
+        if not chunk:
+            continue
+        values = parse_column(chunk)
+        results, flags = _compute(mode, values)
+        inputs = np.array(chunk, dtype=object)
+        columns = [inputs] + [format_column(result) for result in results] + [flags]
+        out.write(("\n".join(map(",".join, zip(*columns))) + "\n").encode("utf-8"))
+
+        if preview is None:
+            preview = {name: list(column[:PREVIEW_ROWS]) for name, column in zip(COLUMNS[mode], columns)}
+        rows += len(chunk)
+        flagged += int(np.count_nonzero(flags != ""))
+
+    return out.getvalue(), rows, flagged, preview
@@ -0,0 +1,46 @@
+import os
+
+
+def _flag(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Render every Encyclopedia slider frame in a background process pool once the
+# Encyclopedia is first opened
+WARM_ENCYCLOPEDIA_FRAMES = _flag("MATHBOOK_WARM_FRAMES", False)
+
+# Idle figures kept for reuse by mathbook.figures.subplots
+FIGURE_POOL_SIZE = int(os.environ.get("MATHBOOK_FIGURE_POOL_SIZE", "8"))
+
+# Show the sidebar debug panel (figure counts and bytes)
+DEBUG = _flag("MATHBOOK_DEBUG", False)
+
+# Background PDF builder: worker threads and finished PDFs kept by input key
+PDF_WORKERS = int(os.environ.get("MATHBOOK_PDF_WORKERS", "2"))
+PDF_CACHE_SIZE = int(os.environ.get("MATHBOOK_PDF_CACHE_SIZE", "64"))
+
+# Backend for simple line diagrams (mathbook.diagrams): "svg" or "matplotlib"
+DIAGRAM_BACKEND = os.environ.get("MATHBOOK_DIAGRAMS", "svg").strip().lower()
+
+# Rendered right-triangle diagrams kept by mathbook.right_triangle, shared by all sessions
+RIGHT_TRIANGLE_CACHE_SIZE = int(os.environ.get("MATHBOOK_TRIANGLE_CACHE_SIZE", "256"))
+
+# Per-session byte budget for uploads and objects kept by mathbook.sessions,
+# and how long a session may sit idle before they are evicted
+SESSION_BUDGET_BYTES = int(float(os.environ.get("MATHBOOK_SESSION_BUDGET_MB", "64")) * 1024 * 1024)
+SESSION_IDLE_SECONDS = float(os.environ.get("MATHBOOK_SESSION_IDLE_S", "600"))
+
+# Worker processes that draw matplotlib figures off the script thread (0 draws
+# them inline), figures allowed in flight at once, and seconds to wait for one
+RENDER_WORKERS = int(os.environ.get("MATHBOOK_RENDER_WORKERS", str(os.cpu_count() or 1)))
+RENDER_QUEUE = int(os.environ.get("MATHBOOK_RENDER_QUEUE", "32"))
+RENDER_TIMEOUT_S = float(os.environ.get("MATHBOOK_RENDER_TIMEOUT_S", "30"))
+
+# Timing spans around page renders and figure emits (see mathbook.tracing)
+TRACE = _flag("MATHBOOK_TRACE", False)
+TRACE_FILE = os.environ.get("MATHBOOK_TRACE_FILE", "")
+TRACE_FILE_MAX_BYTES = int(os.environ.get("MATHBOOK_TRACE_FILE_MAX_BYTES", str(10 * 1024 * 1024)))
+PROM_FILE = os.environ.get("MATHBOOK_PROM_FILE", "")
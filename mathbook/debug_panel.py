@@ -0,0 +1,31 @@
+import sys
+
+import streamlit as st
+
+
+def show_debug_panel(trace=None):
+    with st.sidebar.expander("🛠 Debug"):
+        # Only report on subsystems this process has actually loaded
+        if "mathbook.figures" in sys.modules:
+            st.markdown("**Figures**")
+            st.json(sys.modules["mathbook.figures"].stats())
+        if "mathbook.pdf_jobs" in sys.modules:
+            st.markdown("**PDF jobs**")
+            st.json(sys.modules["mathbook.pdf_jobs"].get_pdf_jobs().stats())
+        if "mathbook.render_pool" in sys.modules:
+            st.markdown("**Render pool**")
+            st.json(sys.modules["mathbook.render_pool"].get_render_pool().stats())
+        if "mathbook.right_triangle" in sys.modules:
+            st.markdown("**Right-triangle cache**")
+            st.json(sys.modules["mathbook.right_triangle"].get_cache().stats())
+        if "mathbook.sessions" in sys.modules:
+            sessions = sys.modules["mathbook.sessions"]
+            st.markdown("**Session memory**")
+            st.json({"this_session": sessions.get_store().usage(sessions.session_id()), **sessions.get_store().stats()})
+        if trace is not None:
+            st.markdown(f"**Last rerun: {trace['total_ms']:.1f} ms**")
+            rows = [
+                f"| {'&nbsp;' * 4 * s['depth']}{s['name']} | {s['ms']:.1f} | {s['self_ms']:.1f} |"
+                for s in trace["spans"]
+            ]
+            st.markdown("\n".join(["| span | ms | self ms |", "| --- | ---: | ---: |"] + rows))
@@ -0,0 +1,171 @@
+"""Simple line diagrams rendered straight to SVG, without matplotlib.
+
+A Diagram collects primitives in data coordinates (segments, polylines,
+arcs, circles, polygons and text) and turns them into an SVG string in
+well under a millisecond. The same diagram can be replayed onto a
+matplotlib Axes, so ``show()`` can emit either one: the backend comes
+from MATHBOOK_DIAGRAMS (``svg`` by default) or the ``backend`` argument.
+Styles follow matplotlib's defaults so both backends look alike.
+"""
+import math
+from html import escape
+
+import streamlit as st
+
+from mathbook import config
+
+# matplotlib's single-letter colours
+_COLORS = {
+    "b": "#0000ff", "g": "#008000", "r": "#ff0000", "c": "#00bfbf",
+    "m": "#bf00bf", "y": "#bfbf00", "k": "#000000", "w": "#ffffff",
+}
+
+LINE_WIDTH = 1.5
+FONT_SIZE = 10
+# Points to pixels at matplotlib's 100 dpi
+_PT = 100 / 72
+
+
+def _color(color):
+    return _COLORS.get(color, color) if color else "none"
+
+
+def _nonsingular(low, high):
+    return (low - 0.5, high + 0.5) if low == high else (low, high)
+
+
+class Diagram:
+    def __init__(self, xlim, ylim, width=640, height=480, equal=False):
+        self.xlim = _nonsingular(*xlim)
+        self.ylim = _nonsingular(*ylim)
+        self.equal = equal
+        sx = width / (self.xlim[1] - self.xlim[0])
+        sy = height / (self.ylim[1] - self.ylim[0])
+        if equal:
+            scale = min(abs(sx), abs(sy))
+            sx, sy = math.copysign(scale, sx), math.copysign(scale, sy)
+        self._sx, self._sy = sx, sy
+        self._items = []
+
+    def _px(self, x, y):
+        # SVG's y axis points down
+        return (x - self.xlim[0]) * self._sx, (self.ylim[1] - y) * self._sy
+
+    def segment(self, x0, y0, x1, y1, color="k", width=LINE_WIDTH):
+        return self.polyline([x0, x1], [y0, y1], color, width)
+
+    def polyline(self, xs, ys, color="k", width=LINE_WIDTH):
+        self._items.append(("polyline", (list(xs), list(ys)), {"color": color, "width": width}))
+        return self
+
+    def arc(self, cx, cy, r, theta1, theta2, color="k", width=LINE_WIDTH):
+        """Counter-clockwise arc from theta1 to theta2 degrees, like matplotlib's Arc."""
+        self._items.append(("arc", (cx, cy, r, theta1, theta2), {"color": color, "width": width}))
+        return self
+
+    def circle(self, cx, cy, r, color="k", fill=None, width=LINE_WIDTH):
+        self._items.append(("circle", (cx, cy, r), {"color": color, "fill": fill, "width": width}))
+        return self
+
+    def polygon(self, points, color="k", fill=None, width=LINE_WIDTH):
+        self._items.append(("polygon", ([tuple(p) for p in points],), {"color": color, "fill": fill, "width": width}))
+        return self
+
+    def text(self, x, y, s, color="k", size=FONT_SIZE):
+        self._items.append(("text", (x, y, str(s)), {"color": color, "size": size}))
+        return self
+
+    def to_svg(self):
+        body, xs, ys = [], [], []
+
+        def extend(points):
+            for x, y in points:
+                xs.append(x)
+                ys.append(y)
+
+        for kind, args, style in self._items:
+            stroke = f'stroke="{_color(style.get("color"))}" stroke-width="{style.get("width", LINE_WIDTH) * _PT:.2f}"'
+            if kind == "polyline":
+                points = [self._px(x, y) for x, y in zip(*args)]
+                extend(points)
+                coords = " ".join(f"{x:.2f},{y:.2f}" for x, y in points)
+                body.append(f'<polyline points="{coords}" fill="none" {stroke} stroke-linecap="square"/>')
+            elif kind == "arc":
+                cx, cy, r, theta1, theta2 = args
+                t1, t2 = math.radians(theta1), math.radians(theta2)
+                x0, y0 = self._px(cx + r * math.cos(t1), cy + r * math.sin(t1))
+                x1, y1 = self._px(cx + r * math.cos(t2), cy + r * math.sin(t2))
+                rx, ry = abs(r * self._sx), abs(r * self._sy)
+                large = 1 if (theta2 - theta1) % 360 > 180 else 0
+                # Counter-clockwise in data is clockwise on screen unless an axis is flipped
+                sweep = 0 if (self._sx > 0) == (self._sy > 0) else 1
+                extend(self._px(cx + r * math.cos(t), cy + r * math.sin(t)) for t in (t1, (t1 + t2) / 2, t2))
+                body.append(f'<path d="M {x0:.2f} {y0:.2f} A {rx:.2f} {ry:.2f} 0 {large} {sweep} {x1:.2f} {y1:.2f}" fill="none" {stroke}/>')
+            elif kind == "circle":
+                cx, cy, r = args
+                x, y = self._px(cx, cy)
+                rx, ry = abs(r * self._sx), abs(r * self._sy)
+                extend([(x - rx, y - ry), (x + rx, y + ry)])
+                body.append(f'<ellipse cx="{x:.2f}" cy="{y:.2f}" rx="{rx:.2f}" ry="{ry:.2f}" fill="{_color(style["fill"])}" {stroke}/>')
+            elif kind == "polygon":
+                points = [self._px(x, y) for x, y in args[0]]
+                extend(points)
+                coords = " ".join(f"{x:.2f},{y:.2f}" for x, y in points)
+                body.append(f'<polygon points="{coords}" fill="{_color(style["fill"])}" {stroke}/>')
+            elif kind == "text":
+                x, y, s = args
+                x, y = self._px(x, y)
+                size = style["size"] * _PT
+                # Rough text extent so the tight bounding box leaves room for labels
+                extend([(x, y - size), (x + 0.6 * size * len(s), y + 0.25 * size)])
+                body.append(f'<text x="{x:.2f}" y="{y:.2f}" fill="{_color(style["color"])}" font-size="{size:.1f}" font-family="DejaVu Sans, sans-serif">{escape(s)}</text>')
+
+        # Crop to the drawing, like st.pyplot's bbox_inches="tight"
+        pad = 6
+        if xs:
+            left, top = min(xs) - pad, min(ys) - pad
+            width, height = max(xs) - left + pad, max(ys) - top + pad
+        else:
+            left = top = 0
+            width = height = 2 * pad
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{left:.2f} {top:.2f} {width:.2f} {height:.2f}" '
+            f'width="{width:.0f}" height="{height:.0f}">' + "".join(body) + "</svg>"
+        )
+
+    def draw(self, ax):
+        """Replay the diagram onto a matplotlib Axes."""
+        from matplotlib.patches import Arc, Circle, Polygon
+
+        for kind, args, style in self._items:
+            if kind == "polyline":
+                ax.plot(*args, color=_color(style["color"]), linewidth=style["width"])
+            elif kind == "arc":
+                cx, cy, r, theta1, theta2 = args
+                ax.add_patch(Arc((cx, cy), 2 * r, 2 * r, theta1=theta1, theta2=theta2, color=_color(style["color"]), linewidth=style["width"]))
+            elif kind == "circle":
+                cx, cy, r = args
+                ax.add_patch(Circle((cx, cy), r, edgecolor=_color(style["color"]), facecolor=_color(style["fill"]),
+                                    fill=style["fill"] is not None, linewidth=style["width"]))
+            elif kind == "polygon":
+                ax.add_patch(Polygon(args[0], edgecolor=_color(style["color"]), facecolor=_color(style["fill"]),
+                                     fill=style["fill"] is not None, linewidth=style["width"]))
+            elif kind == "text":
+                ax.text(*args, color=_color(style["color"]), fontsize=style["size"])
+        ax.set_xlim(*self.xlim)
+        ax.set_ylim(*self.ylim)
+        if self.equal:
+            ax.set_aspect('equal')
+        ax.axis('off')
+
+
+def show(diagram, backend=None):
+    """Emit a diagram with the chosen backend ("svg" or "matplotlib")."""
+    if (backend or config.DIAGRAM_BACKEND) == "svg":
+        st.image(diagram.to_svg(), use_column_width=True)
+        return
+    from mathbook.figures import subplots
+
+    with subplots() as (fig, ax):
+        diagram.draw(ax)
+        st.pyplot(fig)
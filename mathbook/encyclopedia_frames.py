@@ -0,0 +1,119 @@
+import io
+import math
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import streamlit as st
+
+from mathbook import config, workers
+
+# Every value the Encyclopedia unit-circle slider ("uc_angle") can take; the
+# right triangle is cheap enough as SVG to come from mathbook.right_triangle
+FRAME_ANGLES = {
+    "unit_circle": range(0, 361),
+}
+
+
+def _figure_to_png(fig):
+    # Same options st.pyplot uses, so cached frames look identical
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    return buf.getvalue()
+
+
+# matplotlib is imported inside the renderers so importing this module (and
+# starting the warm-up) stays cheap for pages that never draw a frame
+def render_unit_circle(angle_deg):
+    from matplotlib.patches import Arc, Circle
+    from mathbook.figures import subplots
+
+    angle_rad = math.radians(angle_deg)
+
+    with subplots() as (fig, ax):
+        ax.add_patch(Circle((0, 0), 1, color='lightblue', fill=False))
+        ax.plot([0, math.cos(angle_rad)], [0, math.sin(angle_rad)], 'r-')
+        ax.plot([math.cos(angle_rad), math.cos(angle_rad)], [0, math.sin(angle_rad)], 'g--')
+        ax.plot([0, math.cos(angle_rad)], [0, 0], 'b--')
+        ax.text(0.5, -0.1, 'cos(θ)', color='b')
+        ax.text(math.cos(angle_rad) + 0.01, math.sin(angle_rad)/2, 'sin(θ)', color='g')
+        ax.add_patch(Arc((0,0), 0.5, 0.5, theta1=0, theta2=angle_deg if angle_deg <= 180 else angle_deg - 360, color='purple'))
+        ax.text(0.2, 0.1, f'θ = {angle_deg}°', color='purple')
+        ax.set_xlim(-1.2, 1.2)
+        ax.set_ylim(-1.2, 1.2)
+        ax.set_aspect('equal')
+        ax.axis('off')
+        return _figure_to_png(fig)
+
+
+RENDERERS = {
+    "unit_circle": render_unit_circle,
+}
+
+
+def _render_frame(kind, angle_deg):
+    # Runs in a worker process; returns the key alongside the bytes
+    return kind, angle_deg, RENDERERS[kind](angle_deg)
+
+
+class FrameCache:
+    def __init__(self):
+        self._frames = {}
+
+    def __len__(self):
+        return len(self._frames)
+
+    def get(self, kind, angle_deg):
+        key = (kind, angle_deg)
+        frame = self._frames.get(key)
+        if frame is None:
+            # Not warmed yet (or warm-up disabled): render inline and keep it
+            frame = RENDERERS[kind](angle_deg)
+            self._frames[key] = frame
+        return frame
+
+    def warm_up(self, max_workers=None):
+        # Workers are started here, on the script thread, where the app's
+        # directory is still on sys.path for them to inherit
+        max_workers = max_workers or os.cpu_count() or 1
+        executor = workers.process_pool(max_workers)
+        # Feed them from a thread of our own so the page never waits; it
+        # keeps one frame per worker in flight and shuts the pool down when
+        # done, so no worker outlives it
+        threading.Thread(target=self._feed, args=(executor, max_workers), name="frame-warm-up", daemon=True).start()
+
+    def _feed(self, executor, in_flight):
+        pending = set()
+        try:
+            for kind, angles in FRAME_ANGLES.items():
+                for angle_deg in angles:
+                    if (kind, angle_deg) in self._frames:
+                        continue
+                    if len(pending) >= in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self._store(future)
+                    pending.add(executor.submit(_render_frame, kind, angle_deg))
+            for future in wait(pending).done:
+                self._store(future)
+        except (RuntimeError, BrokenProcessPool):
+            # The interpreter is exiting, or a worker died: frames left are
+            # rendered on demand instead
+            pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _store(self, future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        kind, angle_deg, frame = future.result()
+        self._frames.setdefault((kind, angle_deg), frame)
+
+
+@st.cache_resource
+def get_frame_cache():
+    cache = FrameCache()
+    if config.WARM_ENCYCLOPEDIA_FRAMES:
+        cache.warm_up()
+    return cache
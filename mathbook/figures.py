@@ -0,0 +1,112 @@
+import sys
+import threading
+from contextlib import contextmanager
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from mathbook import config, tracing
+
+_SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
+
+
+class FigurePool:
+    """Bounded pool of reusable Agg figures.
+
+    Figures are created with the object-oriented API, so pyplot never holds a
+    reference to them; a figure is either checked out, parked in the pool, or
+    garbage.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._idle = []
+        self._live = set()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self, figsize=None):
+        with self._lock:
+            if self._idle:
+                fig = self._idle.pop()
+                self.reused += 1
+            else:
+                fig = Figure()
+                FigureCanvasAgg(fig)
+                self.created += 1
+            self._live.add(fig)
+        fig.set_size_inches(figsize or matplotlib.rcParams["figure.figsize"])
+        return fig
+
+    def release(self, fig):
+        fig.clear()
+        fig.subplots_adjust(**{k: matplotlib.rcParams[f"figure.subplot.{k}"] for k in _SUBPLOT_PARAMS})
+        with self._lock:
+            self._live.discard(fig)
+            if len(self._idle) < self.max_size:
+                self._idle.append(fig)
+            else:
+                self.discarded += 1
+
+    def stats(self):
+        with self._lock:
+            live = list(self._live)
+            idle = list(self._idle)
+        return {
+            "live_figures": len(live),
+            "pooled_figures": len(idle),
+            "pool_size": self.max_size,
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "live_bytes": sum(_canvas_bytes(fig) for fig in live),
+            "pooled_bytes": sum(_canvas_bytes(fig) for fig in idle),
+            "pyplot_open_figures": _pyplot_open_figures(),
+        }
+
+
+def _canvas_bytes(fig):
+    # The Agg renderer keeps its RGBA buffer around between draws
+    renderer = getattr(fig.canvas, "renderer", None)
+    if renderer is None:
+        return 0
+    return int(renderer.width) * int(renderer.height) * 4
+
+
+def _pyplot_open_figures():
+    # Anything still registered with pyplot bypassed the pool and will leak
+    plt = sys.modules.get("matplotlib.pyplot")
+    return len(plt.get_fignums()) if plt else 0
+
+
+_pool = FigurePool(config.FIGURE_POOL_SIZE)
+
+
+@contextmanager
+def subplots(nrows=1, ncols=1, figsize=None, **kwargs):
+    """Drop-in for ``plt.subplots`` that always returns the figure to the pool."""
+    fig = _pool.acquire(figsize)
+    try:
+        with tracing.span("figure"):
+            yield fig, fig.subplots(nrows, ncols, **kwargs)
+    finally:
+        _pool.release(fig)
+
+
+
+@contextmanager
+def figure(figsize=None):
+    """A pooled empty figure, for callers that lay out their own axes."""
+    fig = _pool.acquire(figsize)
+    try:
+        with tracing.span("figure"):
+            yield fig
+    finally:
+        _pool.release(fig)
+
+
+def stats():
+    return _pool.stats()
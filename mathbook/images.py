@@ -0,0 +1,38 @@
+import hashlib
+import io
+
+from PIL import Image
+
+# Longest side kept after decoding; plenty for the preview and a 200pt PDF slot
+MAX_SIDE = 1600
+
+
+def image_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_base_image(data, max_side=MAX_SIDE):
+    """Decode an upload at reduced size.
+
+    JPEG draft mode lets libjpeg decode straight at 1/2, 1/4 or 1/8 scale,
+    so a 12 MP photo is never materialized at full resolution; other
+    formats are thumbnailed after decoding. Returns the base image and the
+    original pixel size. Pages keep it per session (mathbook.sessions) and
+    treat it as read-only.
+    """
+    image = Image.open(io.BytesIO(data))
+    original_size = image.size
+    image.draft("RGB", (max_side, max_side))
+    image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    image.thumbnail((max_side, max_side))
+    return image, original_size
+
+
+def encode_image(image):
+    """Encode once for both preview and PDF: JPEG for photos, PNG if there's alpha."""
+    buf = io.BytesIO()
+    if image.mode == "RGBA":
+        image.save(buf, format="PNG", optimize=True)
+    else:
+        image.save(buf, format="JPEG", quality=85, optimize=True)
+    return buf.getvalue()
@@ -0,0 +1,126 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from mathbook import config
+
+
+class PDFJobs:
+    """Builds PDFs on a small worker pool and keeps finished ones by key.
+
+    The key is the tuple of inputs that fully determine the document, so
+    asking for the same PDF again (from any session) is a cache hit and a
+    request for a PDF that is still being built joins the running job.
+    """
+
+    def __init__(self, max_workers, max_cached):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdf")
+        self._running = {}
+        self._finished = OrderedDict()
+        self._max_cached = max_cached
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def submit(self, key, build, *args):
+        with self._lock:
+            if key in self._finished:
+                self._finished.move_to_end(key)
+                self.hits += 1
+                return key
+            if key in self._running and not self._running[key].done():
+                return key
+            self.misses += 1
+            future = self._executor.submit(build, *args)
+            self._running[key] = future
+        future.add_done_callback(lambda f: self._store(key, f))
+        return key
+
+    def _store(self, key, future):
+        if future.exception() is not None:
+            # Leave the failed future in _running so status() can report it
+            return
+        with self._lock:
+            self._running.pop(key, None)
+            self._finished[key] = future.result()
+            while len(self._finished) > self._max_cached:
+                self._finished.popitem(last=False)
+
+    def status(self, key):
+        with self._lock:
+            if key in self._finished:
+                return "done"
+            future = self._running.get(key)
+        if future is None:
+            return "missing"
+        if not future.done():
+            return "running"
+        return "failed" if future.exception() is not None else "done"
+
+    def result(self, key):
+        with self._lock:
+            pdf = self._finished.get(key)
+            future = self._running.get(key)
+        if pdf is None and future is not None and future.done() and future.exception() is None:
+            # Finished but the done-callback hasn't stored it yet
+            pdf = future.result()
+        return pdf
+
+    def error(self, key):
+        with self._lock:
+            future = self._running.get(key)
+        return future.exception() if future is not None and future.done() else None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "running": sum(not f.done() for f in self._running.values()),
+                "cached": len(self._finished),
+                "cached_bytes": sum(len(pdf) for pdf in self._finished.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+@st.cache_resource
+def get_pdf_jobs():
+    return PDFJobs(config.PDF_WORKERS, config.PDF_CACHE_SIZE)
+
+
+def pdf_button(label, key, build, *args, download_label, file_name):
+    """Generate-then-download button pair backed by the shared job pool.
+
+    ``key`` identifies the document (its inputs); ``build(*args)`` returns
+    the PDF bytes and runs off the script thread. The download button stays
+    available for as long as the inputs match the job that was started.
+    """
+    jobs = get_pdf_jobs()
+    state_key = f"pdf_job_{file_name}"
+    if st.button(label):
+        st.session_state[state_key] = jobs.submit(key, build, *args)
+    if st.session_state.get(state_key) != key:
+        return
+    _job_status(key, download_label, file_name)
+
+
+def _job_status(key, download_label, file_name):
+    jobs = get_pdf_jobs()
+    status = jobs.status(key)
+    if status == "done":
+        st.download_button(download_label, jobs.result(key), file_name, "application/pdf")
+    elif status == "failed":
+        st.error(f"Could not build the PDF: {jobs.error(key)}")
+    elif status == "running":
+        _poll_job(key)
+
+
+@st.fragment(run_every=1)
+def _poll_job(key):
+    # Re-runs just this fragment every second until the job is finished,
+    # then reruns the page once so the download button replaces it
+    if get_pdf_jobs().status(key) == "running":
+        st.info("Building your PDF...")
+    else:
+        st.rerun()
@@ -0,0 +1,202 @@
+"""Vectorized measurements for many polygons at once.
+
+Polygons are kept as one flat ``(n_vertices, 2)`` coordinate array plus an
+``offsets`` array: polygon i is ``coords[offsets[i]:offsets[i + 1]]``, not
+closed (the last vertex connects back to the first). Every measurement is
+a handful of whole-array operations, with ``np.add.reduceat`` doing the
+per-polygon sums, so thousands of uploaded shapes cost about as much as
+one.
+"""
+import io
+import json
+from dataclasses import dataclass
+
+import numpy as np
+
+COLUMNS = ["polygon", "vertices", "area", "perimeter", "centroid_x", "centroid_y", "angle_sum"]
+
+
+@dataclass(frozen=True)
+class PolygonSet:
+    coords: np.ndarray
+    offsets: np.ndarray
+    names: list
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def polygon(self, i):
+        return self.coords[self.offsets[i]:self.offsets[i + 1]]
+
+    def split(self):
+        return np.split(self.coords, self.offsets[1:-1])
+
+
+def from_rings(rings, names=None):
+    """Build a PolygonSet from a list of vertex lists.
+
+    A repeated closing vertex is dropped; rings with fewer than three
+    distinct vertices are skipped (and so are their names).
+    """
+    kept, kept_names = [], []
+    for i, ring in enumerate(rings):
+        ring = np.asarray(ring, dtype=np.float64).reshape(-1, 2)
+        if len(ring) > 1 and np.array_equal(ring[0], ring[-1]):
+            ring = ring[:-1]
+        if len(ring) >= 3:
+            kept.append(ring)
+            kept_names.append(str(names[i]) if names is not None else str(len(kept)))
+    counts = np.array([len(ring) for ring in kept], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    coords = np.concatenate(kept) if kept else np.empty((0, 2))
+    return PolygonSet(coords, offsets, kept_names)
+
+
+def from_csv(data):
+    """Rows of ``polygon_id,x,y``; consecutive rows with the same id are one polygon.
+
+    A first row whose x is not a number is taken as a header.
+    """
+    text = data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data
+    rows = [line.split(",")[:3] for line in io.StringIO(text) if line.strip()]
+    rows = [[field.strip().strip('"') for field in row] for row in rows if len(row) == 3]
+    if rows:
+        try:
+            float(rows[0][1])
+        except ValueError:
+            rows = rows[1:]
+    if not rows:
+        return from_rings([])
+    ids = np.array([row[0] for row in rows])
+    xy = np.array([row[1:] for row in rows], dtype=np.float64)
+    starts = np.flatnonzero(np.concatenate([[True], ids[1:] != ids[:-1]]))
+    return from_rings(np.split(xy, starts[1:]), ids[starts])
+
+
+def _outer_ring(part, where):
+    if not isinstance(part, list) or not part:
+        raise ValueError(f"{where} has no rings")
+    ring = part[0]
+    if not isinstance(ring, list) or not all(
+        isinstance(vertex, list) and len(vertex) >= 2
+        and all(isinstance(c, (int, float)) and not isinstance(c, bool) for c in vertex[:2])
+        for vertex in ring
+    ):
+        raise ValueError(f"{where} has a ring that is not a list of [x, y] positions")
+    return [vertex[:2] for vertex in ring]
+
+
+def from_geojson(data):
+    """Polygon and MultiPolygon geometries (outer rings only) from GeoJSON.
+
+    Anything that is not GeoJSON of that shape raises ValueError.
+    """
+    doc = json.loads(data)
+    if not isinstance(doc, dict):
+        raise ValueError(f"GeoJSON must be an object, not {type(doc).__name__}")
+    if doc.get("type") == "FeatureCollection":
+        features = doc.get("features")
+        if not isinstance(features, list):
+            raise ValueError("FeatureCollection has no features list")
+    elif doc.get("type") == "Feature":
+        features = [doc]
+    else:
+        features = [{"geometry": doc}]
+    rings, names = [], []
+    for n, feature in enumerate(features, 1):
+        if not isinstance(feature, dict):
+            raise ValueError(f"feature {n} is not an object")
+        geometry = feature.get("geometry") or {}
+        properties = feature.get("properties") or {}
+        if not isinstance(geometry, dict) or not isinstance(properties, dict):
+            raise ValueError(f"feature {n} has a geometry or properties that is not an object")
+        name = properties.get("name", feature.get("id", n))
+        if geometry.get("type") == "Polygon":
+            parts = [geometry.get("coordinates")]
+        elif geometry.get("type") == "MultiPolygon":
+            parts = geometry.get("coordinates")
+            if not isinstance(parts, list):
+                raise ValueError(f"feature {n}: MultiPolygon coordinates must be a list")
+        else:
+            continue
+        for j, part in enumerate(parts):
+            rings.append(_outer_ring(part, f"feature {n} ({geometry['type']})"))
+            names.append(name if len(parts) == 1 else f"{name}.{j + 1}")
+    return from_rings(rings, names)
+
+
+def load(data, file_name=""):
+    if file_name.lower().endswith((".json", ".geojson")):
+        return from_geojson(data)
+    if not file_name:
+        stripped = data.lstrip() if isinstance(data, str) else data.lstrip().decode("utf-8", errors="replace")
+        if stripped.startswith("{"):
+            return from_geojson(data)
+    return from_csv(data)
+
+
+def _neighbours(offsets, n):
+    # Index of the next and previous vertex, wrapping within each polygon
+    starts, ends = offsets[:-1], offsets[1:] - 1
+    nxt = np.arange(1, n + 1)
+    nxt[ends] = starts
+    prev = np.arange(-1, n - 1)
+    prev[starts] = ends
+    return nxt, prev
+
+
+def measure(polygons):
+    """Per-polygon area, perimeter, centroid and per-vertex interior angles.
+
+    Returns a dict of arrays: ``area``, ``perimeter``, ``centroid_x``,
+    ``centroid_y``, ``vertices`` and ``angle_sum`` have one entry per
+    polygon; ``angles`` (degrees) is aligned with ``polygons.coords``.
+    Vertices may be listed clockwise or counter-clockwise.
+    """
+    coords, offsets = polygons.coords, polygons.offsets
+    if len(polygons) == 0:
+        empty = np.empty(0)
+        return {name: empty for name in ("area", "perimeter", "centroid_x", "centroid_y", "vertices", "angle_sum", "angles")}
+    x, y = coords[:, 0], coords[:, 1]
+    nxt, prev = _neighbours(offsets, len(coords))
+    starts = offsets[:-1]
+    counts = np.diff(offsets)
+
+    # Shoelace: twice the signed area is the sum of edge cross products
+    cross = x * y[nxt] - x[nxt] * y
+    area2 = np.add.reduceat(cross, starts)
+    perimeter = np.add.reduceat(np.hypot(x[nxt] - x, y[nxt] - y), starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cx = np.add.reduceat((x + x[nxt]) * cross, starts) / (3 * area2)
+        cy = np.add.reduceat((y + y[nxt]) * cross, starts) / (3 * area2)
+    # Zero-area polygons have no area centroid; use the vertex mean
+    flat = ~np.isfinite(cx)
+    cx[flat] = (np.add.reduceat(x, starts) / counts)[flat]
+    cy[flat] = (np.add.reduceat(y, starts) / counts)[flat]
+
+    # Interior angle = 180° minus the turn at the vertex, signed by orientation
+    in_x, in_y = x - x[prev], y - y[prev]
+    out_x, out_y = x[nxt] - x, y[nxt] - y
+    turn = np.degrees(np.arctan2(in_x * out_y - in_y * out_x, in_x * out_x + in_y * out_y))
+    orientation = np.repeat(np.where(area2 < 0, -1.0, 1.0), counts)
+    angles = 180 - orientation * turn
+
+    return {
+        "area": np.abs(area2) / 2,
+        "perimeter": perimeter,
+        "centroid_x": cx,
+        "centroid_y": cy,
+        "vertices": counts,
+        "angle_sum": np.add.reduceat(angles, starts),
+        "angles": angles,
+    }
+
+
+def to_csv(polygons, results):
+    out = io.StringIO()
+    out.write(",".join(COLUMNS) + "\n")
+    columns = [np.array(polygons.names, dtype=object), results["vertices"].astype(str)] + [
+        (np.round(results[name], 6) + 0.0).astype(str) for name in COLUMNS[2:]
+    ]
+    out.write("".join(",".join(row) + "\n" for row in zip(*columns)))
+    return out.getvalue().encode("utf-8")
@@ -0,0 +1,103 @@
+"""Projectile flight over whole grids of launch angles and speeds.
+
+Without drag the range, apex and flight time have closed forms and a grid
+is a single broadcast. With quadratic air drag (deceleration k·|v|·v)
+every cell of the grid is stepped forward together by a fixed-step
+midpoint integrator; each cell gets its own step so that every flight is
+resolved in about ``steps`` steps, however short it is.
+"""
+import numpy as np
+
+G = 9.8
+STEPS = 400
+
+
+def _vacuum(theta, v, g):
+    vy = v * np.sin(theta)
+    return {
+        "range": v**2 * np.sin(2 * theta) / g,
+        "apex": vy**2 / (2 * g),
+        "flight_time": 2 * vy / g,
+    }
+
+
+def _integrate(theta, v, drag, g, steps, record=False):
+    x = np.zeros_like(theta)
+    y = np.zeros_like(theta)
+    vx = v * np.cos(theta)
+    vy = v * np.sin(theta)
+    # Drag only shortens the climb, so the vacuum flight time bounds the
+    # step; flights that stay up longer simply take more steps
+    dt = 2 * vy / g / steps
+    t = np.zeros_like(theta)
+    apex = np.zeros_like(theta)
+    flight_range = np.zeros_like(theta)
+    flight_time = np.zeros_like(theta)
+    active = dt > 0
+    path = [(x.copy(), y.copy())] if record else None
+
+    for _ in range(20 * steps):
+        if not active.any():
+            break
+        h = np.where(active, dt, 0.0)
+        speed = np.hypot(vx, vy)
+        vx_mid = vx - 0.5 * h * drag * speed * vx
+        vy_mid = vy - 0.5 * h * (g + drag * speed * vy)
+        speed_mid = np.hypot(vx_mid, vy_mid)
+        x_new = x + h * vx_mid
+        y_new = y + h * vy_mid
+        vx = vx - h * drag * speed_mid * vx_mid
+        vy = vy - h * (g + drag * speed_mid * vy_mid)
+
+        # Interpolate the landing point inside the step that crossed y = 0
+        landed = active & (y_new <= 0)
+        frac = np.divide(y, y - y_new, out=np.ones_like(y), where=landed)
+        flight_range = np.where(landed, x + frac * (x_new - x), flight_range)
+        flight_time = np.where(landed, t + frac * h, flight_time)
+        y_new = np.where(landed, 0.0, y_new)
+        x_new = np.where(landed, x + frac * (x_new - x), x_new)
+
+        apex = np.maximum(apex, y_new)
+        x, y, t = x_new, y_new, t + h
+        active &= ~landed
+        if record:
+            path.append((x.copy(), y.copy()))
+
+    result = {"range": flight_range, "apex": apex, "flight_time": flight_time}
+    return result, path
+
+
+def sweep(angles_deg, velocities, drag=0.0, g=G, steps=STEPS):
+    """Range, apex height and flight time for every angle × velocity pair.
+
+    Returns a dict of arrays shaped ``(len(angles_deg), len(velocities))``.
+    ``drag`` is the quadratic drag coefficient k in 1/m (0 for vacuum).
+    """
+    theta = np.radians(np.asarray(angles_deg, dtype=np.float64))[:, None]
+    v = np.asarray(velocities, dtype=np.float64)[None, :]
+    theta, v = np.broadcast_arrays(theta, v)
+    if drag == 0:
+        return _vacuum(theta, v, g)
+    return _integrate(theta, v, drag, g, steps)[0]
+
+
+def trajectories(angles_deg, velocities, drag=0.0, g=G, steps=STEPS):
+    """Flight paths for paired angles and velocities, as a list of (x, y)."""
+    theta = np.radians(np.atleast_1d(np.asarray(angles_deg, dtype=np.float64)))
+    v = np.atleast_1d(np.asarray(velocities, dtype=np.float64))
+    theta, v = np.broadcast_arrays(theta, v)
+    if drag == 0:
+        flight_time = _vacuum(theta, v, g)["flight_time"]
+        t = np.linspace(0, 1, steps + 1)[:, None] * flight_time
+        xs = v * np.cos(theta) * t
+        ys = np.maximum(v * np.sin(theta) * t - 0.5 * g * t**2, 0)
+    else:
+        _, path = _integrate(theta, v, drag, g, steps, record=True)
+        xs = np.array([p[0] for p in path])
+        ys = np.array([p[1] for p in path])
+    paths = []
+    for i in range(theta.size):
+        # Drop the repeated points after landing
+        keep = np.concatenate([[True], np.diff(xs[:, i]) != 0]) | (ys[:, i] > 0)
+        paths.append((xs[keep, i], ys[keep, i]))
+    return paths
@@ -0,0 +1,259 @@
+"""Quiz question banks: fixed items plus procedurally generated numeric ones.
+
+A bank file in mathbook/question_banks/ lists hand-written questions and
+the generators to expand, e.g. ``{"generator": "polygon_angles",
+"max_sides": 2000}``. Generated items come with their answer key and
+distractors worked out at load time, seeded from the file, so every
+session sees the same bank. Banks are loaded once per process and a quiz
+only keeps the indices of its draw in session state.
+"""
+import json
+import math
+import os
+import random
+from dataclasses import dataclass
+from fractions import Fraction
+
+import streamlit as st
+
+BANK_DIR = os.path.join(os.path.dirname(__file__), "question_banks")
+
+
+@dataclass(frozen=True, slots=True)
+class Question:
+    question: str
+    options: tuple
+    answer: str
+
+
+class QuestionBank:
+    """Questions in one flat list, grouped by where they came from.
+
+    Draws take one item per group in turn, so a short quiz mixes the
+    hand-written questions with each kind of generated one instead of
+    being swamped by the largest generator.
+    """
+
+    def __init__(self, groups):
+        self._items = []
+        self._groups = []
+        for items in groups:
+            if items:
+                self._groups.append((len(self._items), len(self._items) + len(items)))
+                self._items.extend(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def draw(self, n, rng=random):
+        n = min(n, len(self._items))
+        groups = rng.sample(self._groups, len(self._groups))
+        picked = []
+        while len(picked) < n:
+            for start, stop in groups:
+                if len(picked) == n:
+                    break
+                index = rng.randrange(start, stop)
+                if index not in picked:
+                    picked.append(index)
+        return picked
+
+
+def _fmt(x):
+    x = round(x, 2)
+    return str(int(x)) if x == int(x) else f"{x:g}"
+
+
+def _pi(k):
+    return "π" if k == 1 else f"{_fmt(k)}π"
+
+
+def _question(rng, question, answer, candidates):
+    # Three distinct wrong options from the candidates, shuffled in with the answer
+    wrong = list(dict.fromkeys(c for c in candidates if c != answer))
+    options = [answer] + rng.sample(wrong, min(3, len(wrong)))
+    rng.shuffle(options)
+    return Question(question, tuple(options), answer)
+
+
+_EXACT = {
+    0.0: "0",
+    0.5: "1/2",
+    round(math.sqrt(2) / 2, 9): "√2/2",
+    round(math.sqrt(3) / 2, 9): "√3/2",
+    1.0: "1",
+    round(math.sqrt(3) / 3, 9): "√3/3",
+    round(math.sqrt(3), 9): "√3",
+}
+_EXACT_VALUES = ["Undefined"] + [sign + s for s in _EXACT.values() for sign in ("", "-") if s != "0" or not sign]
+
+
+def _exact(value):
+    text = _EXACT[round(abs(value), 9) + 0.0]
+    return "-" + text if value < 0 and text != "0" else text
+
+
+def _special_angles(rng, min_angle, max_angle):
+    items = []
+    for angle in range(min_angle, max_angle + 1, 15):
+        if angle % 30 and angle % 45:
+            continue
+        rad = math.radians(angle)
+        values = {"sin": math.sin(rad), "cos": math.cos(rad)}
+        values["tan"] = None if angle % 180 == 90 else math.tan(rad)
+        for name, value in values.items():
+            answer = "Undefined" if value is None else _exact(value)
+            items.append(_question(rng, f"What is {name}({angle}°)?", answer, _EXACT_VALUES))
+    return items
+
+
+def _radians(fraction):
+    if fraction == 0:
+        return "0"
+    sign = "-" if fraction < 0 else ""
+    num, den = abs(fraction.numerator), fraction.denominator
+    text = "π" if num == 1 else f"{num}π"
+    return sign + (text if den == 1 else f"{text}/{den}")
+
+
+def _degrees_to_radians(rng, min_angle, max_angle, step):
+    items = []
+    for angle in range(min_angle, max_angle + 1, step):
+        answer = _radians(Fraction(angle, 180))
+        candidates = [_radians(f) for f in (
+            Fraction(angle, 360), Fraction(angle, 90), Fraction(angle + step, 180),
+            Fraction(angle - step, 180), Fraction(-angle, 180), Fraction(angle + 180, 180),
+        )]
+        items.append(_question(rng, f"Convert {angle}° to radians.", answer, candidates))
+    return items
+
+
+def _inverse_trig(rng):
+    items = []
+    principal = {"arcsin": (-90, 90, math.sin), "arccos": (0, 180, math.cos), "arctan": (-75, 75, math.tan)}
+    for name, (low, high, f) in principal.items():
+        seen = set()
+        for angle in range(low, high + 1, 15):
+            if angle % 30 and angle % 45:
+                continue
+            value = _exact(f(math.radians(angle)))
+            if value in seen:
+                continue
+            seen.add(value)
+            candidates = [f"{a}°" for a in range(-180, 181, 30)] + [f"{a}°" for a in (-135, -45, 45, 135)]
+            items.append(_question(rng, f"What is {name}({value}) in degrees?", f"{angle}°", candidates))
+    return items
+
+
+def _polygon_angles(rng, max_sides):
+    items = []
+    for n in range(3, max_sides + 1):
+        total = (n - 2) * 180
+        items.append(_question(
+            rng, f"What is the sum of the interior angles of a {n}-sided polygon?", f"{total}°",
+            [f"{t}°" for t in ((n - 1) * 180, n * 180, (n - 3) * 180, (n - 2) * 90, total + 360)],
+        ))
+        interior = 180 - 360 / n
+        items.append(_question(
+            rng, f"What is each interior angle of a regular {n}-sided polygon?", f"{_fmt(interior)}°",
+            [f"{_fmt(t)}°" for t in (360 / n, 180 - 180 / n, 180 * (n - 1) / n, interior + 10, interior - 10)],
+        ))
+    return items
+
+
+def _rectangle_areas(rng, max_side):
+    items = []
+    for length in range(1, max_side + 1):
+        for width in range(1, max_side + 1):
+            area = length * width
+            items.append(_question(
+                rng, f"What is the area of a {length} × {width} rectangle?", _fmt(area),
+                [_fmt(t) for t in (2 * (length + width), length + width, area + length, area + width, area * 3, area + 1)],
+            ))
+    return items
+
+
+def _triangle_areas(rng, max_side):
+    items = []
+    for base in range(1, max_side + 1):
+        for height in range(1, max_side + 1):
+            area = base * height / 2
+            items.append(_question(
+                rng, f"What is the area of a triangle with base {base} and height {height}?", _fmt(area),
+                [_fmt(t) for t in (base * height, base + height, area + base, area + height, area * 4, area + 1)],
+            ))
+    return items
+
+
+def _circle_areas(rng, max_radius):
+    items = []
+    for r in range(1, max_radius + 1):
+        items.append(_question(
+            rng, f"What is the area of a circle with radius {r}?", _pi(r * r),
+            [_pi(t) for t in (2 * r, r, 2 * r * r, 4 * r * r, r * r + 1, r * r / 2)],
+        ))
+    return items
+
+
+GENERATORS = {
+    "special_angles": _special_angles,
+    "degrees_to_radians": _degrees_to_radians,
+    "inverse_trig": _inverse_trig,
+    "polygon_angles": _polygon_angles,
+    "rectangle_areas": _rectangle_areas,
+    "triangle_areas": _triangle_areas,
+    "circle_areas": _circle_areas,
+}
+
+
+def load_bank(path):
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    rng = random.Random(spec.get("seed", 0))
+    groups = [[Question(q["question"], tuple(q["options"]), q["answer"]) for q in spec.get("questions", [])]]
+    for params in spec.get("generate", []):
+        params = dict(params)
+        generator = GENERATORS[params.pop("generator")]
+        groups.append(generator(rng, **params))
+    return QuestionBank(groups)
+
+
+@st.cache_resource(show_spinner=False)
+def get_bank(name):
+    return load_bank(os.path.join(BANK_DIR, f"{name}.json"))
+
+
+def _new_draw(bank_name, key, num_questions):
+    st.session_state[f"{key}_draw"] = get_bank(bank_name).draw(num_questions)
+    st.session_state[f"{key}_results"] = {}
+
+
+def show_quiz(bank_name, key, num_questions):
+    """Multiple-choice quiz drawn from a bank, scored in session state.
+
+    The draw and the per-question results live under ``key`` in session
+    state, so the score survives reruns until "New questions" is pressed.
+    """
+    bank = get_bank(bank_name)
+    if f"{key}_draw" not in st.session_state:
+        _new_draw(bank_name, key, num_questions)
+    results = st.session_state[f"{key}_results"]
+
+    for i, index in enumerate(st.session_state[f"{key}_draw"]):
+        q = bank[index]
+        st.subheader(f"Question {i+1}: {q.question}")
+        answer = st.radio("Choose:", q.options, key=f"{key}_{index}")
+        if st.button(f"Submit Q{i+1}", key=f"{key}_submit_{index}"):
+            results[index] = answer == q.answer
+        if index in results:
+            if results[index]:
+                st.success("Correct!")
+            else:
+                st.error(f"Wrong! Correct answer: {q.answer}")
+
+    if st.button("Show Score", key=f"{key}_score"):
+        st.markdown(f"Your score: {sum(results.values())}/{len(st.session_state[f'{key}_draw'])}")
+    st.button("New questions", key=f"{key}_new", on_click=_new_draw, args=(bank_name, key, num_questions))
@@ -0,0 +1,61 @@
+import importlib
+from dataclasses import dataclass
+
+from mathbook import tracing
+
+
+@dataclass(frozen=True)
+class Page:
+    id: str
+    label: str
+    icon: str
+    module: str
+    function: str
+    category: str = "Trigonometry"
+
+    @property
+    def button_label(self):
+        return f"{self.icon} {self.label}"
+
+    def show(self):
+        show = load_page(self)
+        with tracing.span(f"page:{self.id}"):
+            show()
+
+
+# Every page, in sidebar order. Modules are imported on first navigation
+# only, so a rerun loads just the active page and its dependencies.
+PAGES = [
+    Page("Encyclopedia", "Encyclopedia", "📚", "pages.trig_encyclopedia", "show_trig_encyclopedia"),
+    Page("Trig Calculator", "Trig Calculator", "🧮", "pages.trig_calculator", "show_trig_calculator"),
+    Page("Quiz", "Quiz", "❓", "pages.trig_quiz", "show_trig_quiz"),
+    Page("Real-World Applications", "Real-World Applications", "🌍", "pages.trig_real_world", "show_trig_real_world"),
+    Page("AR Unit Circle", "AR Unit Circle", "🔄", "pages.trig_ar_unit_circle", "show_trig_ar_unit_circle"),
+    Page("VR Environments", "VR Environments", "🌐", "pages.trig_vr_environments", "show_trig_vr_environments"),
+    Page("Story Creator", "Story Creator", "📖", "pages.trig_story_creator", "show_trig_story_creator"),
+    Page("Clinometer Simulator", "Clinometer Simulator", "📏", "pages.trig_clinometer", "show_trig_clinometer"),
+    Page("Puzzles & Games", "Puzzles & Games", "🧩", "pages.trig_puzzles_games", "show_trig_puzzles_games"),
+    Page("Spinner & Sketcher", "Spinner & Sketcher", "🎡", "pages.trig_spinner_sketcher", "show_trig_spinner_sketcher"),
+    Page("Radian Crafts", "Radian Crafts", "🎨", "pages.trig_radian_crafts", "show_trig_radian_crafts"),
+    Page("Motion & Waves", "Motion & Waves", "🚀", "pages.trig_motion_waves", "show_trig_motion_waves"),
+    Page("Geometry", "Geometry", "🔲", "pages.geometry", "show_geometry_page", category="Geometry"),
+]
+
+PAGES_BY_ID = {page.id: page for page in PAGES}
+
+# Which pages each entry point offers
+APP_PAGES = [PAGES_BY_ID[page_id] for page_id in (
+    "Encyclopedia", "Trig Calculator", "Quiz", "Real-World Applications", "Geometry",
+)]
+SINGLEPAGE_PAGES = [page for page in PAGES if page.category == "Trigonometry"]
+
+_loaded = {}
+
+
+def load_page(page):
+    show = _loaded.get(page.id)
+    if show is None:
+        with tracing.span(f"import:{page.module}"):
+            show = getattr(importlib.import_module(page.module), page.function)
+        _loaded[page.id] = show
+    return show
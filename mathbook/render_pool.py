@@ -0,0 +1,193 @@
+"""Matplotlib rendering in worker processes.
+
+Streamlit runs every session's script as a thread of one process, so a
+figure drawn and encoded on the script thread holds the GIL and stalls
+every other session while it does. Figures drawn through this module are
+sent as a spec instead: a module-level ``draw(fig, *args)`` function and
+its (picklable) arguments. A worker process draws it into an empty figure
+of the requested size, saves it with st.pyplot's options and returns the
+PNG bytes, so sessions rendering at the same time use separate cores.
+
+The pool takes at most MATHBOOK_RENDER_QUEUE figures at once (queued or
+drawing) and waits MATHBOOK_RENDER_TIMEOUT_S for each; past either limit
+the page gets a warning in place of the figure instead of queueing up
+behind everyone else. Identical specs requested while one is in flight
+share its result.
+"""
+import io
+import threading
+from concurrent.futures import TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import streamlit as st
+
+from mathbook import config, tracing, workers
+
+
+class RenderError(Exception):
+    pass
+
+
+class RenderQueueFull(RenderError):
+    pass
+
+
+class RenderTimeout(RenderError):
+    pass
+
+
+class RenderWorkerLost(RenderError):
+    pass
+
+
+def _init_worker():
+    # Pay for matplotlib once per worker, not in the first figure
+    import mathbook.figures  # noqa: F401
+
+
+def render_png(draw, args, figsize=None):
+    """Draw one spec and encode it; runs in a worker (or inline)."""
+    from mathbook.figures import figure
+
+    with figure(figsize) as fig:
+        draw(fig, *args)
+        buf = io.BytesIO()
+        # Same options st.pyplot uses
+        fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+        return buf.getvalue()
+
+
+def _spec_key(draw, args, figsize):
+    key = (draw.__module__, draw.__qualname__, args, figsize)
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable arguments (arrays): still rendered, just never shared
+        return None
+    return key
+
+
+class RenderPool:
+    def __init__(self, max_workers, max_queue, timeout_s):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout_s = timeout_s
+        self._executor = None
+        # spec key (or a unique object) -> future, for every figure queued or drawing
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self.rendered = 0
+        self.joined = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.failed = 0
+
+    def start(self):
+        """The executor, starting the workers first if this is the first figure.
+
+        None if figures are drawn inline (MATHBOOK_RENDER_WORKERS=0).
+        """
+        executor = self._executor
+        if executor is None and self.max_workers > 0:
+            # Starting workers takes a while; only callers that need them
+            # wait, not sessions sharing a figure or reading stats()
+            with self._start_lock:
+                if self._executor is None:
+                    self._executor = workers.process_pool(self.max_workers, initializer=_init_worker)
+                executor = self._executor
+        return executor
+
+    def _reset(self, executor):
+        with self._start_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, executor, draw, args, figsize):
+        key = _spec_key(draw, args, figsize)
+        with self._lock:
+            future = self._pending.get(key) if key is not None else None
+            if future is not None:
+                self.joined += 1
+                return future
+            if len(self._pending) >= self.max_queue:
+                self.rejected += 1
+                raise RenderQueueFull(f"{len(self._pending)} figures already queued")
+            try:
+                future = executor.submit(render_png, draw, args, figsize)
+            except BrokenProcessPool:
+                raise
+            except RuntimeError:
+                # Shut down by another session that found it broken
+                raise RenderWorkerLost("the rendering workers were restarted") from None
+            key = key if key is not None else object()
+            self._pending[key] = future
+        future.add_done_callback(lambda f: self._done(key, f))
+        return future
+
+    def _done(self, key, future):
+        with self._lock:
+            self._pending.pop(key, None)
+            if future.exception() is None:
+                self.rendered += 1
+            else:
+                self.failed += 1
+
+    def render(self, draw, *args, figsize=None):
+        """PNG bytes of ``draw(fig, *args)``, drawn in a worker process."""
+        if self.max_workers <= 0:
+            return render_png(draw, args, figsize)
+        with tracing.span("render_pool"):
+            try:
+                executor = self.start()
+            except (OSError, NotImplementedError):
+                # This host cannot start worker processes: draw inline from now on
+                self.max_workers = 0
+                return render_png(draw, args, figsize)
+            try:
+                future = self._submit(executor, draw, args, figsize)
+                # A timed-out figure keeps its worker (and queue slot) until it finishes
+                return future.result(timeout=self.timeout_s)
+            except TimeoutError:
+                with self._lock:
+                    self.timeouts += 1
+                raise RenderTimeout(f"not drawn within {self.timeout_s:g} s") from None
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool next time
+                self._reset(executor)
+                raise RenderWorkerLost("a rendering worker stopped unexpectedly") from None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": len(self._pending),
+                "max_queue": self.max_queue,
+                "timeout_s": self.timeout_s,
+                "rendered": self.rendered,
+                "joined": self.joined,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "failed": self.failed,
+            }
+
+
+@st.cache_resource
+def get_render_pool():
+    return RenderPool(config.RENDER_WORKERS, config.RENDER_QUEUE, config.RENDER_TIMEOUT_S)
+
+
+def show_rendered(render, *args, **kwargs):
+    """Show the PNG ``render(*args, **kwargs)`` returns, or a warning if the pool could not draw it."""
+    try:
+        png = render(*args, **kwargs)
+    except RenderError as e:
+        st.warning(f"The figure could not be drawn right now ({e}). Rerun the page to try again.")
+        return
+    st.image(png, use_column_width=True)
+
+
+def show_figure(draw, *args, figsize=None):
+    """Render ``draw(fig, *args)`` off the script thread and show it like st.pyplot."""
+    show_rendered(get_render_pool().render, draw, *args, figsize=figsize)
@@ -0,0 +1,143 @@
+import io
+import math
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+from mathbook import config
+from mathbook.diagrams import Diagram
+
+# Display precision: angles are shown to 0.1° and lengths to 2 decimals, so
+# inputs that only differ below that draw the same picture and share a key
+ANGLE_DECIMALS = 1
+LENGTH_DECIMALS = 2
+
+# Steepest angle drawn: 89.95° to 89.99° would round up to 90°, where the
+# opposite side of a given adjacent side has no finite length
+MAX_ANGLE = 89.99
+
+
+def quantize(angle_deg, length):
+    """Round the inputs that define the picture, never rounding a steep angle up to 90°.
+
+    Raises ValueError unless 0 < ``angle_deg`` < 90: there is no right
+    triangle to draw, and callers should say so rather than draw one.
+    """
+    angle_deg = float(angle_deg)
+    if not 0 < angle_deg < 90:
+        raise ValueError(f"a right triangle needs 0° < θ < 90°, got {angle_deg:g}°")
+    angle = min(max(round(angle_deg, ANGLE_DECIMALS), 10 ** -ANGLE_DECIMALS), MAX_ANGLE)
+    return angle, round(float(length), LENGTH_DECIMALS)
+
+
+def diagram(angle_deg, adjacent=None, labels=None, angle_label=None, extent=None, hypotenuse=None):
+    """The right triangle with angle θ at the origin and the right angle at (adjacent, 0).
+
+    The triangle is given by θ and either its ``adjacent`` side or its
+    ``hypotenuse``. ``labels`` names the (adjacent, opposite, hypotenuse)
+    sides; a None entry is left unlabelled. ``extent`` fixes both axes to
+    (0, extent) instead of fitting them to the triangle.
+    """
+    if hypotenuse is not None:
+        adjacent = hypotenuse * math.cos(math.radians(angle_deg))
+        opposite = hypotenuse * math.sin(math.radians(angle_deg))
+    else:
+        opposite = adjacent * math.tan(math.radians(angle_deg))
+    size = math.hypot(adjacent, opposite)
+    width = adjacent * 1.2 if extent is None else extent
+    if extent is None:
+        d = Diagram((0, width), (0, opposite * 1.2))
+    else:
+        d = Diagram((0, extent), (0, extent))
+    # Near 90° the triangle is far taller than wide; sizing the arc and the
+    # label offsets by the width keeps them inside the picture
+    r = min(0.1 * size, 0.3 * width)
+    d.segment(0, 0, adjacent, 0, 'b')
+    d.segment(adjacent, 0, adjacent, opposite, 'g')
+    d.segment(0, 0, adjacent, opposite, 'r')
+    d.arc(0, 0, r, 0, angle_deg, 'purple')
+    d.text(1.2 * r, 0.02 * size, f'θ = {angle_deg:g}°' if angle_label is None else angle_label, 'purple')
+    adjacent_label, opposite_label, hypotenuse_label = labels or (None, None, None)
+    if adjacent_label:
+        d.text(adjacent / 2, -0.03 * size, adjacent_label, 'b')
+    if opposite_label:
+        d.text(adjacent + min(0.01 * size, 0.03 * width), opposite / 2, opposite_label, 'g')
+    if hypotenuse_label:
+        d.text(adjacent / 2, opposite / 2, hypotenuse_label, 'r')
+    return d
+
+
+def _render(key):
+    backend, angle_deg, adjacent, hypotenuse, labels, angle_label, extent = key
+    d = diagram(angle_deg, adjacent, labels, angle_label, extent, hypotenuse)
+    if backend == "svg":
+        return d.to_svg()
+    from mathbook.figures import subplots
+
+    with subplots() as (fig, ax):
+        d.draw(ax)
+        buf = io.BytesIO()
+        # Same options st.pyplot uses
+        fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+        return buf.getvalue()
+
+
+class RenderCache:
+    """Bounded LRU of rendered right triangles, shared by every session."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+        # Render outside the lock; two sessions racing on a miss both draw it
+        image = _render(key)
+        with self._lock:
+            self._images[key] = image
+            while len(self._images) > self.max_size:
+                self._images.popitem(last=False)
+        return image
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cached": len(self._images),
+                "max_size": self.max_size,
+                "cached_bytes": sum(len(image) for image in self._images.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "miss_rate": round(self.misses / lookups, 3) if lookups else None,
+            }
+
+
+@st.cache_resource
+def get_cache():
+    return RenderCache(config.RIGHT_TRIANGLE_CACHE_SIZE)
+
+
+def render(angle_deg, adjacent=None, labels=None, angle_label=None, extent=None, hypotenuse=None, backend=None):
+    """SVG text or PNG bytes of the triangle, from the shared cache."""
+    if hypotenuse is not None:
+        angle_deg, hypotenuse = quantize(angle_deg, hypotenuse)
+    else:
+        angle_deg, adjacent = quantize(angle_deg, adjacent)
+    key = (backend or config.DIAGRAM_BACKEND, angle_deg, adjacent, hypotenuse,
+           tuple(labels) if labels else None, angle_label, extent)
+    return get_cache().get(key)
+
+
+def show_right_triangle(angle_deg, adjacent=None, labels=None, angle_label=None, extent=None, hypotenuse=None):
+    st.image(render(angle_deg, adjacent, labels, angle_label, extent, hypotenuse), use_column_width=True)
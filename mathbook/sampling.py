@@ -0,0 +1,47 @@
+import numpy as np
+
+
+def adaptive_sample(f, x_min, x_max, y_range, width_px=1200, height_px=600,
+                    pixel_error=0.5, initial_points=33, max_depth=16):
+    """Sample a vectorized ``f`` on [x_min, x_max] for plotting.
+
+    Intervals are halved wherever the curve bends away from the straight
+    segment by more than ``pixel_error`` pixels (for a plot ``width_px`` x
+    ``height_px`` showing ``y_range``), so points pile up where curvature is
+    high and straight stretches stay sparse. Intervals that lie entirely
+    off-screen are left alone. Poles are detected as sign-changing jumps
+    taller than the plot and returned as NaN breaks, which matplotlib and
+    Plotly both draw as a gap instead of a vertical line.
+    """
+    y_min, y_max = y_range
+    sx = width_px / (x_max - x_min)
+    sy = height_px / (y_max - y_min)
+
+    x = np.linspace(x_min, x_max, initial_points)
+    with np.errstate(all="ignore"):
+        y = f(x)
+        for _ in range(max_depth):
+            xm = (x[:-1] + x[1:]) / 2
+            ym = f(xm)
+            error = np.abs(ym - (y[:-1] + y[1:]) / 2) * sy
+            above = (y[:-1] > y_max) & (ym > y_max) & (y[1:] > y_max)
+            below = (y[:-1] < y_min) & (ym < y_min) & (y[1:] < y_min)
+            wide = (x[1:] - x[:-1]) * sx > 0.05
+            refine = ((error > pixel_error) | ~np.isfinite(error)) & ~above & ~below & wide
+            if not refine.any():
+                break
+            at = np.nonzero(refine)[0] + 1
+            x = np.insert(x, at, xm[refine])
+            y = np.insert(y, at, ym[refine])
+
+    return _break_at_poles(x, y, sy, height_px)
+
+
+def _break_at_poles(x, y, sy, height_px):
+    jump = np.abs(np.diff(y)) * sy > height_px
+    flips = np.sign(y[:-1]) != np.sign(y[1:])
+    poles = np.nonzero(jump & flips)[0] + 1
+    if not len(poles):
+        return x, y
+    gaps = (x[poles - 1] + x[poles]) / 2
+    return np.insert(x, poles, gaps), np.insert(y.astype(float), poles, np.nan)
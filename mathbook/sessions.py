@@ -0,0 +1,186 @@
+"""Per-session memory accounting with a byte budget and idle eviction.
+
+Large objects a session keeps between reruns (decoded uploads, rendered
+previews, per-session figures) go through ``cached()`` instead of
+st.session_state, so the store knows what each session holds and how big
+it is. Pages report their file_uploader values with ``note_upload()``.
+Together that is checked against MATHBOOK_SESSION_BUDGET_MB; past it, the
+session's least recently used objects are dropped (they are rebuilt on
+demand). A session that has not rerun for MATHBOOK_SESSION_IDLE_S loses
+all of its objects, so abandoned tabs stop holding memory before their
+websocket closes. Uploaded files are never removed here: the student may
+still be reading the page, and Streamlit drops them when the session
+closes.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from mathbook import config
+
+# Idle sessions are looked for at most this often, piggybacking on reruns
+SWEEP_INTERVAL_S = 30
+
+
+def nbytes(value):
+    """Rough retained size: exact for bytes, strings, arrays and images."""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sum(nbytes(item) for item in value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if hasattr(value, "getbands"):
+        # PIL image: one byte per band per pixel
+        return value.size[0] * value.size[1] * len(value.getbands())
+    return sys.getsizeof(value)
+
+
+class SessionStore:
+    def __init__(self, budget_bytes, idle_seconds):
+        self.budget_bytes = budget_bytes
+        self.idle_seconds = idle_seconds
+        # session id -> {"last_seen": monotonic time, "objects": OrderedDict(key -> (value, nbytes, category)),
+        #                "uploads": {uploader name -> nbytes}}
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+        self.budget_evictions = 0
+        self.idle_evictions = 0
+        self.evicted_objects = 0
+        self.evicted_bytes = 0
+
+    def _session(self, session_id):
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = {"last_seen": time.monotonic(), "objects": OrderedDict(), "uploads": {}}
+        return session
+
+    def touch(self, session_id):
+        with self._lock:
+            self._session(session_id)["last_seen"] = time.monotonic()
+
+    def get(self, session_id, key):
+        with self._lock:
+            session = self._session(session_id)
+            session["last_seen"] = time.monotonic()
+            entry = session["objects"].get(key)
+            if entry is None:
+                return None
+            session["objects"].move_to_end(key)
+            return entry[0]
+
+    def set_upload(self, session_id, name, size):
+        with self._lock:
+            uploads = self._session(session_id)["uploads"]
+            if size:
+                uploads[name] = size
+            else:
+                uploads.pop(name, None)
+
+    def put(self, session_id, key, value, size, category):
+        with self._lock:
+            session = self._session(session_id)
+            session["last_seen"] = time.monotonic()
+            objects = session["objects"]
+            objects[key] = (value, size, category)
+            objects.move_to_end(key)
+            # Over budget: drop least recently used objects, never the one just
+            # stored. Uploads count but are not ours to drop.
+            held = sum(session["uploads"].values()) + sum(entry[1] for entry in objects.values())
+            while held > self.budget_bytes and len(objects) > 1:
+                _, (_, evicted, _) = objects.popitem(last=False)
+                held -= evicted
+                self.budget_evictions += 1
+                self.evicted_objects += 1
+                self.evicted_bytes += evicted
+
+    def sweep(self, now=None):
+        """Evict the objects held by sessions idle longer than ``idle_seconds``.
+
+        Only rebuildable objects go; a session that comes back rebuilds
+        them and reports its uploads again on its next rerun.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._last_sweep = now
+            idle = [sid for sid, s in self._sessions.items() if now - s["last_seen"] > self.idle_seconds]
+            dropped = [self._sessions.pop(sid) for sid in idle]
+            for session in dropped:
+                self.idle_evictions += 1
+                self.evicted_objects += len(session["objects"])
+                self.evicted_bytes += sum(entry[1] for entry in session["objects"].values())
+        return len(idle)
+
+    def maybe_sweep(self):
+        if time.monotonic() - self._last_sweep >= SWEEP_INTERVAL_S:
+            self.sweep()
+
+    def usage(self, session_id):
+        """Bytes the session holds, by category, plus its uploaded files."""
+        with self._lock:
+            session = self._sessions.get(session_id, {"objects": {}, "uploads": {}})
+            objects = list(session["objects"].values())
+            usage = {"uploads": sum(session["uploads"].values())}
+        for _, size, category in objects:
+            usage[category] = usage.get(category, 0) + size
+        usage["total"] = sum(usage.values())
+        usage["budget"] = self.budget_bytes
+        return usage
+
+    def stats(self):
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "objects": sum(len(s["objects"]) for s in self._sessions.values()),
+                "held_bytes": sum(entry[1] for s in self._sessions.values() for entry in s["objects"].values()),
+                "budget_evictions": self.budget_evictions,
+                "idle_evictions": self.idle_evictions,
+                "evicted_objects": self.evicted_objects,
+                "evicted_bytes": self.evicted_bytes,
+            }
+
+
+@st.cache_resource
+def get_store():
+    return SessionStore(config.SESSION_BUDGET_BYTES, config.SESSION_IDLE_SECONDS)
+
+
+def session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+def start_rerun():
+    """Mark the current session active and, now and then, evict idle ones."""
+    sid = session_id()
+    if sid is None:
+        return
+    store = get_store()
+    store.touch(sid)
+    store.maybe_sweep()
+
+
+def note_upload(name, uploaded_file):
+    """Count a file_uploader's current file (None when cleared) against this session's budget."""
+    sid = session_id()
+    if sid is None:
+        return
+    get_store().set_upload(sid, name, uploaded_file.size if uploaded_file is not None else 0)
+
+
+def cached(key, build, category="renders", size=nbytes):
+    """This session's copy of ``build()``, kept in the store under ``key``."""
+    sid = session_id()
+    if sid is None:
+        return build()
+    store = get_store()
+    value = store.get(sid, key)
+    if value is None:
+        value = build()
+        store.put(sid, key, value, size(value), category)
+    return value
@@ -0,0 +1,26 @@
+import json
+import os
+
+import streamlit as st
+
+ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+
+@st.cache_resource(show_spinner=False)
+def load_manifest(group):
+    with open(os.path.join(ASSET_DIR, group, "manifest.json")) as f:
+        return json.load(f)
+
+
+@st.cache_resource(show_spinner=False)
+def asset(group, name, fmt="svg"):
+    """Contents of a prerendered diagram or sound (see tools/build_assets.py).
+
+    SVGs come back as text, which st.image inlines; PNGs and WAVs as bytes.
+    """
+    path = os.path.join(ASSET_DIR, group, load_manifest(group)["assets"][name][fmt])
+    if fmt == "svg":
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    with open(path, "rb") as f:
+        return f.read()
@@ -0,0 +1,205 @@
+"""Opt-in timing spans for page renders (MATHBOOK_TRACE=1).
+
+Each script run is one trace: the entry point calls start_rerun() first
+and finish_rerun() last, and everything in between can open nested
+span()s. Page entry points and figure emits are wrapped automatically:
+registry pages, st.pyplot (with savefig and draw inside it), st.image,
+st.plotly_chart (with Plotly's figure validation and JSON serialization).
+Time a span spends outside its children is its "self" time, which for a
+page is the NumPy/Python work done before any figure is emitted.
+
+Finished traces go to the sidebar debug panel, to a rolling JSON-lines
+file (MATHBOOK_TRACE_FILE) and to a Prometheus text-format file
+(MATHBOOK_PROM_FILE) that a node-exporter style scraper can read.
+"""
+import functools
+import importlib.abc
+import importlib.machinery
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+from mathbook import config
+
+_local = threading.local()
+_lock = threading.Lock()
+_installed = False
+
+# Recent traces from every session, newest last
+recent = deque(maxlen=200)
+# span name -> [count, total seconds], for the Prometheus file
+_totals = defaultdict(lambda: [0, 0.0])
+
+
+def start_rerun(entry_point):
+    if not config.TRACE:
+        return
+    _install()
+    _local.trace = {"entry_point": entry_point, "ts": time.time(), "t0": time.perf_counter(), "spans": [], "stack": []}
+
+
+@contextmanager
+def span(name):
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        yield
+        return
+    stack = trace["stack"]
+    record = {
+        "name": name,
+        "parent": stack[-1]["name"] if stack else None,
+        "depth": len(stack),
+        "start_ms": (time.perf_counter() - trace["t0"]) * 1000,
+        "child_ms": 0.0,
+    }
+    stack.append(record)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record["ms"] = (time.perf_counter() - t0) * 1000
+        stack.pop()
+        if stack:
+            stack[-1]["child_ms"] += record["ms"]
+        record["self_ms"] = record["ms"] - record.pop("child_ms")
+        trace["spans"].append(record)
+
+
+def finish_rerun():
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return None
+    _local.trace = None
+    result = {
+        "ts": trace["ts"],
+        "entry_point": trace["entry_point"],
+        "total_ms": (time.perf_counter() - trace["t0"]) * 1000,
+        "spans": sorted(trace["spans"], key=lambda s: s["start_ms"]),
+    }
+    with _lock:
+        recent.append(result)
+        for s in result["spans"]:
+            _totals[s["name"]][0] += 1
+            _totals[s["name"]][1] += s["ms"] / 1000
+        _totals["rerun"][0] += 1
+        _totals["rerun"][1] += result["total_ms"] / 1000
+        _write_jsonl(result)
+        _write_prometheus()
+    return result
+
+
+def _write_jsonl(result):
+    path = config.TRACE_FILE
+    if not path:
+        return
+    # Rolling: keep one previous file around, like logging's RotatingFileHandler
+    if os.path.exists(path) and os.path.getsize(path) > config.TRACE_FILE_MAX_BYTES:
+        os.replace(path, path + ".1")
+    with open(path, "a") as f:
+        f.write(json.dumps(result) + "\n")
+
+
+def _write_prometheus():
+    path = config.PROM_FILE
+    if not path:
+        return
+    lines = [
+        "# HELP mathbook_span_seconds Time spent in instrumented render phases.",
+        "# TYPE mathbook_span_seconds summary",
+    ]
+    for name, (count, total) in sorted(_totals.items()):
+        label = name.replace("\\", "\\\\").replace('"', '\\"')
+        lines.append(f'mathbook_span_seconds_sum{{span="{label}"}} {total:.6f}')
+        lines.append(f'mathbook_span_seconds_count{{span="{label}"}} {count}')
+    # Write-then-rename so the scraper never sees a half-written file
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp, path)
+
+
+def _wrap(owner, attr, name):
+    original = getattr(owner, attr)
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        with span(name):
+            return original(*args, **kwargs)
+
+    setattr(owner, attr, wrapper)
+
+
+def _patch_figure(module):
+    _wrap(module.Figure, "savefig", "matplotlib.savefig")
+    _wrap(module.Figure, "draw", "matplotlib.draw")
+
+
+def _patch_plotly_tools(module):
+    _wrap(module, "return_figure_from_figure_or_data", "plotly.validate")
+
+
+def _patch_plotly_json(module):
+    # plotly.io.to_json is looked up in here on every access
+    _wrap(module, "to_json", "plotly.to_json")
+
+
+# Modules tracing patches, but never imports itself: a page that draws no
+# figure should not pay for matplotlib or Plotly just because tracing is on
+_LAZY_PATCHES = {
+    "matplotlib.figure": _patch_figure,
+    "plotly.tools": _patch_plotly_tools,
+    "plotly.io._json": _patch_plotly_json,
+}
+
+
+class _PatchOnImport(importlib.abc.MetaPathFinder):
+    """Patch each pending module right after its first import runs."""
+
+    def __init__(self, patches):
+        self.patches = patches
+
+    def find_spec(self, name, path, target=None):
+        if name not in self.patches:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        if spec is None or not hasattr(spec.loader, "exec_module"):
+            return None
+        patch = self.patches.pop(name, None)
+        if patch is None:
+            return None
+        exec_module = spec.loader.exec_module
+
+        def exec_and_patch(module):
+            exec_module(module)
+            patch(module)
+
+        spec.loader.exec_module = exec_and_patch
+        return spec
+
+
+def _install():
+    # Patch the emit paths once per process; spans are no-ops outside a trace
+    global _installed
+    with _lock:
+        if _installed:
+            return
+        _installed = True
+
+    import streamlit as st
+    _wrap(st, "pyplot", "st.pyplot")
+    _wrap(st, "image", "st.image")
+    _wrap(st, "plotly_chart", "st.plotly_chart")
+
+    # Hook first, then patch what is already loaded, so an import racing
+    # with this is caught by one or the other (dict.pop is atomic)
+    finder = _PatchOnImport(dict(_LAZY_PATCHES))
+    sys.meta_path.insert(0, finder)
+    for name in _LAZY_PATCHES:
+        module = sys.modules.get(name)
+        patch = finder.patches.pop(name, None) if module is not None else None
+        if patch is not None:
+            patch(module)
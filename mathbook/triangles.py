@@ -0,0 +1,176 @@
+import io
+from itertools import islice
+
+import numpy as np
+
+from mathbook.batch_trig import CHUNK_ROWS, PREVIEW_ROWS, format_column, parse_column
+
+# Known parts for each case, in the order they are passed to solve().
+# Lower case are sides, upper case the angle (degrees) opposite that side.
+CASES = {
+    "SSS": ("a", "b", "c"),
+    "SAS": ("a", "C", "b"),
+    "ASA": ("A", "c", "B"),
+    "AAS": ("A", "B", "a"),
+    "SSA": ("a", "b", "A"),
+}
+
+PARTS = ["a", "b", "c", "A", "B", "C", "area", "perimeter"]
+
+# sin(B) this close to 1 is one right-angled solution, not two
+_TOL = 1e-9
+
+
+def _angle(opposite, side1, side2):
+    # Law of cosines; clip so rounding can't push a flat triangle outside arccos
+    cos = (side1**2 + side2**2 - opposite**2) / (2 * side1 * side2)
+    return np.degrees(np.arccos(np.clip(cos, -1, 1)))
+
+
+def _side(known_side, known_angle, angle):
+    # Law of sines
+    return known_side * np.sin(np.radians(angle)) / np.sin(np.radians(known_angle))
+
+
+def _complete(a, b, c, A, B, C, valid):
+    parts = {
+        "a": a, "b": b, "c": c, "A": A, "B": B, "C": C,
+        "area": 0.5 * a * b * np.sin(np.radians(C)),
+        "perimeter": a + b + c,
+    }
+    return {name: np.where(valid, value, np.nan) for name, value in parts.items()}
+
+
+def solve(case, x, y, z):
+    """Solve whole arrays of triangles of one case at once.
+
+    ``x, y, z`` are the known parts in the order of ``CASES[case]``.
+    Returns ``(first, second, flags)``: two dicts of arrays keyed by
+    ``PARTS`` and an array of flag strings. ``second`` is NaN except for
+    SSA rows that have two solutions. Rows that do not describe a
+    triangle are NaN in both and say why in ``flags``.
+    """
+    x, y, z = (np.asarray(v, dtype=np.float64) for v in (x, y, z))
+    flags = np.full(x.shape, "", dtype=object)
+    known = dict(zip(CASES[case], (x, y, z)))
+    sides = [v for name, v in known.items() if name.islower()]
+    angles = [v for name, v in known.items() if name.isupper()]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        bad = ~(np.isfinite(x) & np.isfinite(y) & np.isfinite(z))
+        flags[bad] = "not a number"
+        nonpositive = ~bad & np.logical_or.reduce([s <= 0 for s in sides])
+        flags[nonpositive] = "sides must be positive"
+        wide = ~bad & ~nonpositive & np.logical_or.reduce([(t <= 0) | (t >= 180) for t in angles])
+        flags[wide] = "angles must be between 0° and 180°"
+        ok = flags == ""
+        second = None
+
+        if case == "SSS":
+            a, b, c = x, y, z
+            broken = ok & ((a + b <= c) | (a + c <= b) | (b + c <= a))
+            flags[broken] = "sides fail the triangle inequality"
+            A, B = _angle(a, b, c), _angle(b, a, c)
+            C = 180 - A - B
+        elif case == "SAS":
+            a, C, b = x, y, z
+            c = np.sqrt(a**2 + b**2 - 2 * a * b * np.cos(np.radians(C)))
+            A = _angle(a, b, c)
+            B = 180 - A - C
+        elif case in ("ASA", "AAS"):
+            if case == "ASA":
+                A, c, B = x, y, z
+            else:
+                A, B, a = x, y, z
+            C = 180 - A - B
+            flags[ok & (C <= 0)] = "angles add up to 180° or more"
+            if case == "ASA":
+                a, b = _side(c, C, A), _side(c, C, B)
+            else:
+                b, c = _side(a, A, B), _side(a, A, C)
+        elif case == "SSA":
+            a, b, A = x, y, z
+            sin_b = b * np.sin(np.radians(A)) / a
+            B = np.degrees(np.arcsin(np.clip(sin_b, -1, 1)))
+            C = 180 - A - B
+            flags[ok & ((sin_b > 1 + _TOL) | (C <= 0))] = "side a is too short for angle A"
+            c = _side(a, A, C)
+            # The supplementary angle gives a second triangle when it still fits
+            B2 = 180 - B
+            C2 = 180 - A - B2
+            ambiguous = (flags == "") & (sin_b < 1 - _TOL) & (C2 > 0)
+            flags[ambiguous] = "ambiguous: two triangles"
+            second = _complete(a, b, _side(a, A, C2), A, B2, C2, ambiguous)
+        else:
+            raise ValueError(f"unknown case {case!r}, expected one of {', '.join(CASES)}")
+
+        valid = (flags == "") | (flags == "ambiguous: two triangles")
+        first = _complete(a, b, c, A, B, C, valid)
+    if second is None:
+        second = {name: np.full(x.shape, np.nan) for name in PARTS}
+    return first, second, flags
+
+
+def columns(case):
+    return [f"given_{name}" for name in CASES[case]] + ["solution"] + PARTS + ["flag"]
+
+
+def _iter_rows(stream):
+    rows = (line.split(",")[:3] for line in stream)
+    rows = ([field.strip().strip('"') for field in row] for row in rows)
+    rows = (row + [""] * (3 - len(row)) for row in rows if any(row))
+    while True:
+        chunk = list(islice(rows, CHUNK_ROWS))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(case, data):
+    """Solve a CSV of triangles (first three columns, in ``CASES[case]`` order).
+
+    Works like batch_trig.run_batch: bytes or pasted text in, result CSV
+    bytes, row count, flagged count and a preview out. An ambiguous SSA
+    row becomes two output rows, solution 1 and solution 2.
+    """
+    if isinstance(data, bytes):
+        stream = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="replace")
+    else:
+        stream = io.StringIO(data)
+
+    out = io.BytesIO()
+    out.write((",".join(columns(case)) + "\n").encode("utf-8"))
+    rows = flagged = 0
+    preview = None
+    first_chunk = True
+    for chunk in _iter_rows(stream):
+        if first_chunk:
+            first_chunk = False
+            try:
+                float(chunk[0][0])
+            except ValueError:
+                chunk = chunk[1:]
+        if not chunk:
+            continue
+        given = list(zip(*chunk))
+        first, second, flags = solve(case, *(parse_column(list(field)) for field in given))
+
+        # Interleave the second solutions right after the rows they belong to
+        extra = np.flatnonzero(~np.isnan(second["a"]))
+        index = np.concatenate([np.arange(len(chunk)), extra])
+        solution = np.concatenate([np.full(len(chunk), "1"), np.full(len(extra), "2")]).astype(object)
+        order = np.lexsort((solution, index))
+        index, solution = index[order], solution[order]
+        is_second = solution == "2"
+
+        inputs = [np.array(field, dtype=object)[index] for field in given]
+        parts = [format_column(np.where(is_second, second[name][index], first[name][index])) for name in PARTS]
+        out_columns = inputs + [solution] + parts + [flags[index]]
+        out.write(("\n".join(map(",".join, zip(*out_columns))) + "\n").encode("utf-8"))
+
+        if preview is None:
+            preview = {name: list(column[:PREVIEW_ROWS]) for name, column in zip(columns(case), out_columns)}
+        rows += len(chunk)
+        flagged += int(np.count_nonzero((flags != "") & (flags != "ambiguous: two triangles")))
+
+    return out.getvalue(), rows, flagged, preview
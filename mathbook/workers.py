@@ -0,0 +1,53 @@
+"""Process pools that are safe to start from inside the Streamlit server.
+
+Forking the server copies it mid-flight: a lock another session thread
+holds at that moment (the figure pool's, the tracer's) stays locked in
+the child for good, and fork does not exist on Windows. Workers are
+spawned instead, all of them when the pool is created.
+
+Like any spawned process, a worker first imports the ``__main__`` of the
+process that started it, under the name ``__mp_main__``. Under Streamlit
+that is the app script of the run that created the pool, so app.py and
+app_singlepage.py keep their top-level code under a ``__name__`` guard.
+Tools that run pages through AppTest (whose scripts cannot be guarded)
+start the pools they need from their own main() first.
+
+A pool worker holds both ends of its task queue, so it would wait for
+work forever once the server is gone; each one exits with its parent.
+"""
+import multiprocessing
+import multiprocessing.connection
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _exit_with_parent(parent):
+    multiprocessing.connection.wait([parent.sentinel])
+    os._exit(1)
+
+
+def _start_worker(initializer):
+    # Also covers a server that is killed or exits without shutting its pools down
+    parent = multiprocessing.parent_process()
+    threading.Thread(target=_exit_with_parent, args=(parent,), daemon=True).start()
+    if initializer is not None:
+        initializer()
+
+
+def process_pool(max_workers, initializer=None):
+    """A spawn ProcessPoolExecutor with all ``max_workers`` processes running."""
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_start_worker,
+        initargs=(initializer,),
+    )
+    try:
+        # No worker is idle yet, so every submit launches one more
+        for _ in range(max_workers):
+            executor.submit(int)
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    return executor
@@ -1,7 +1,46 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.patches import Polygon, Circle
+from mathbook.diagrams import Diagram, show
+from mathbook import polygons
+from mathbook.render_pool import show_figure
+from mathbook.question_bank import show_quiz
+from mathbook.sessions import note_upload
+
+PREVIEW_POLYGONS = 20
+SAMPLE_POLYGONS = """polygon,x,y
+square,0,0
+square,2,0
+square,2,2
+square,0,2
+L-shape,3,0
+L-shape,6,0
+L-shape,6,1
+L-shape,4,1
+L-shape,4,3
+L-shape,3,3
+"""
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _measure_polygons(data, file_name):
+    shapes = polygons.load(data, file_name)
+    return shapes, polygons.measure(shapes)
+
+def _draw_polygons(fig, shapes, measured, label_angles):
+    from matplotlib.collections import PolyCollection
+
+    ax = fig.subplots()
+    collection = PolyCollection(shapes.split(), array=measured["area"], cmap='viridis', edgecolor='k', linewidth=0.5, alpha=0.8)
+    ax.add_collection(collection)
+    ax.plot(measured["centroid_x"], measured["centroid_y"], 'r+')
+    if label_angles:
+        for (x, y), angle in zip(shapes.coords, measured["angles"]):
+            ax.annotate(f"{angle:.0f}°", (x, y), textcoords='offset points', xytext=(4, 4), fontsize=8)
+    ax.autoscale_view()
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+def _plot_polygons(shapes, measured, label_angles=False):
+    show_figure(_draw_polygons, shapes, measured, label_angles)
 
 def show_geometry_page():
     st.header("Geometry Explorer")
@@ -30,26 +69,16 @@ def show_geometry_page():
             height = st.slider("Height", 1.0, 10.0, 3.0)
             area = 0.5 * base * height
             
-            fig, ax = plt.subplots()
-            triangle = Polygon([[0, 0], [base, 0], [base/2, height]], color='lightgreen')
-            ax.add_patch(triangle)
-            ax.set_xlim(-1, base + 1)
-            ax.set_ylim(-1, height + 1)
-            ax.axis('equal')
-            st.pyplot(fig)
+            show(Diagram((-1, base + 1), (-1, height + 1), equal=True)
+                 .polygon([[0, 0], [base, 0], [base/2, height]], 'lightgreen', fill='lightgreen'))
             st.markdown(f"Area: {area:.2f} square units")
         
         elif shape == "Circle":
             radius = st.slider("Radius", 1.0, 5.0, 2.0)
             area = np.pi * radius**2
             
-            fig, ax = plt.subplots()
-            circle = Circle((0, 0), radius, color='lightblue', fill=False)
-            ax.add_patch(circle)
-            ax.set_xlim(-radius-1, radius+1)
-            ax.set_ylim(-radius-1, radius+1)
-            ax.axis('equal')
-            st.pyplot(fig)
+            show(Diagram((-radius-1, radius+1), (-radius-1, radius+1), equal=True)
+                 .circle(0, 0, radius, 'lightblue'))
             st.markdown(f"Area: {area:.2f} square units")
         
         elif shape == "Rectangle":
@@ -57,13 +86,8 @@ def show_geometry_page():
             width = st.slider("Width", 1.0, 10.0, 3.0)
             area = length * width
             
-            fig, ax = plt.subplots()
-            rectangle = Polygon([[0, 0], [length, 0], [length, width], [0, width]], color='lightcoral')
-            ax.add_patch(rectangle)
-            ax.set_xlim(-1, length + 1)
-            ax.set_ylim(-1, width + 1)
-            ax.axis('equal')
-            st.pyplot(fig)
+            show(Diagram((-1, length + 1), (-1, width + 1), equal=True)
+                 .polygon([[0, 0], [length, 0], [length, width], [0, width]], 'lightcoral', fill='lightcoral'))
             st.markdown(f"Area: {area:.2f} square units")
 
     with st.expander("2. Angles and Polygons"):
@@ -75,22 +99,16 @@ def show_geometry_page():
         
         ### Visualization
         """)
-        sides = st.slider("Number of polygon sides", 3, 8, 4)
-        angle_sum = (sides - 2) * 180
-        st.markdown(f"Sum of interior angles: {angle_sum}°")
-        
-        fig, ax = plt.subplots()
-        theta = np.linspace(0, 2*np.pi, sides+1)
-        x = np.cos(theta)
-        y = np.sin(theta)
-        ax.plot(x, y, 'b-')
-        ax.set_aspect('equal')
-        ax.axis('off')
-        st.pyplot(fig)
+        sides = st.slider("Number of polygon sides", 3, 8, 4, key="polygon_sides")
+        theta = np.linspace(0, 2*np.pi, sides, endpoint=False)
+        regular = polygons.from_rings([np.column_stack([np.cos(theta), np.sin(theta)])])
+        measured = polygons.measure(regular)
+        st.markdown(f"Sum of interior angles: {measured['angle_sum'][0]:.0f}° (each {measured['angles'][0]:.1f}°)")
+        _plot_polygons(regular, measured, label_angles=True)
 
     with st.expander("3. Geometry Calculator"):
         st.markdown("Calculate areas, perimeters, or volumes of shapes.")
-        calc_type = st.selectbox("Choose calculation", ["Triangle Area", "Circle Circumference", "Cube Volume"])
+        calc_type = st.selectbox("Choose calculation", ["Triangle Area", "Circle Circumference", "Cube Volume", "Polygons (upload)"])
         
         if calc_type == "Triangle Area":
             base = st.number_input("Base", value=5.0)
@@ -108,31 +126,33 @@ def show_geometry_page():
             volume = side**3
             st.markdown(f"Volume: {volume:.2f} cubic units")
 
+        elif calc_type == "Polygons (upload)":
+            st.markdown("Upload a CSV of `polygon,x,y` rows (one row per vertex) or a GeoJSON file, or paste CSV rows below.")
+            uploaded_file = st.file_uploader("Upload polygons", type=["csv", "txt", "json", "geojson"], key="polygon_upload")
+            note_upload("polygon_upload", uploaded_file)
+            pasted = st.text_area("...or paste vertices", SAMPLE_POLYGONS, key="polygon_paste")
+            data, file_name = (uploaded_file.getvalue(), uploaded_file.name) if uploaded_file else (pasted, "")
+            try:
+                shapes, measured = _measure_polygons(data, file_name)
+            except (ValueError, KeyError, TypeError) as e:
+                st.error(f"Could not read the polygons: {e}")
+                shapes = None
+            if shapes is not None and len(shapes):
+                st.markdown(f"{len(shapes):,} polygons, {len(shapes.coords):,} vertices, total area {measured['area'].sum():.2f} square units.")
+                header = " | ".join(polygons.COLUMNS)
+                divider = " | ".join("---" for _ in polygons.COLUMNS)
+                lines = [
+                    f"| {name} | {n} | {area:.2f} | {perimeter:.2f} | {cx:.2f} | {cy:.2f} | {angle_sum:.0f}° |"
+                    for name, n, area, perimeter, cx, cy, angle_sum in zip(
+                        shapes.names[:PREVIEW_POLYGONS], *(measured[c][:PREVIEW_POLYGONS] for c in polygons.COLUMNS[1:])
+                    )
+                ]
+                st.markdown("\n".join([f"| {header} |", f"| {divider} |"] + lines))
+                st.download_button("Download Measurements CSV", polygons.to_csv(shapes, measured), "polygons.csv", "text/csv")
+                _plot_polygons(shapes, measured, label_angles=len(shapes) == 1)
+            elif shapes is not None:
+                st.info("No polygons with at least three vertices found.")
+
     with st.expander("4. Geometry Quiz"):
         st.markdown("Test your geometry knowledge!")
-        questions = [
-            {
-                "question": "What is the sum of angles in a triangle?",
-                "options": ["180°", "360°", "90°", "270°"],
-                "answer": "180°"
-            },
-            {
-                "question": "The formula for the area of a circle is:",
-                "options": ["πr²", "2πr", "r²", "πr"],
-                "answer": "πr²"
-            }
-        ]
-        
-        score = 0
-        for i, q in enumerate(questions):
-            st.subheader(f"Question {i+1}: {q['question']}")
-            answer = st.radio("Choose:", q["options"], key=f"geo_quiz_{i}")
-            if st.button(f"Submit Q{i+1}", key=f"geo_submit_q{i}"):
-                if answer == q["answer"]:
-                    st.success("Correct!")
-                    score += 1
-                else:
-                    st.error(f"Wrong! Correct answer: {q['answer']}")
-        
-        if st.button("Show Score"):
-            st.markdown(f"Your score: {score}/{len(questions)}")
+        show_quiz("geometry", "geo_quiz", num_questions=5)
@@ -1,36 +1,136 @@
 import streamlit as st
 import math
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import numpy as np
+from mathbook.sessions import cached
+
+# Trace order in the unit-circle figure; only these move with the slider
+ARM, POINT, COS_LINE, SIN_LINE = range(4)
+
+@st.cache_resource
+def _sine_wave():
+    # One point per slider step is all the curve needs; rounding keeps the
+    # serialized trace small
+    x = np.radians(np.arange(0, 361))
+    return np.round(x, 4), np.round(np.sin(x), 4)
+
+def _unit_circle_figure():
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=[0, 1], y=[0, 0], mode='lines+markers', name='Angle Arm', line=dict(color='red')))
+    fig.add_trace(go.Scatter(x=[1], y=[0], mode='markers', marker=dict(size=10, color='red'), name='Point'))
+    fig.add_trace(go.Scatter(x=[0, 1], y=[0, 0], mode='lines', line=dict(color='blue', dash='dash'), name='cos(θ)'))
+    fig.add_trace(go.Scatter(x=[1, 1], y=[0, 0], mode='lines', line=dict(color='green', dash='dash'), name='sin(θ)'))
+    fig.add_shape(type="circle", xref="x", yref="y", x0=-1, y0=-1, x1=1, y1=1, line_color="lightblue")
+    fig.update_layout(xaxis=dict(range=[-1.5, 1.5]), yaxis=dict(range=[-1.5, 1.5]), showlegend=True, title="Interactive Unit Circle", uirevision="ar_unit_circle")
+    return fig
+
+def _sine_figure():
+    x_wave, y_wave = _sine_wave()
+    fig_wave = go.Figure()
+    fig_wave.add_trace(go.Scatter(x=x_wave, y=y_wave, mode='lines', name='Sine Wave', line=dict(color='red')))
+    fig_wave.add_trace(go.Scatter(x=[0], y=[0], mode='markers', marker=dict(size=10), name='Current Point'))
+    fig_wave.update_layout(title="Sine Wave", xaxis_title="Angle (radians)", yaxis_title="Value", uirevision="ar_sine_wave")
+    return fig_wave
+
+def _session_figures():
+    # Built once per session; reruns only touch the moving traces
+    return cached("ar_figures", lambda: (_unit_circle_figure(), _sine_figure()), category="figures",
+                  size=lambda figs: sum(len(fig.to_json()) for fig in figs))
+
+def _readout(angle_deg):
+    angle_rad = math.radians(angle_deg)
+    return f"Cos(θ) = {math.cos(angle_rad):.2f}   Sin(θ) = {math.sin(angle_rad):.2f}   Tan(θ) = {math.tan(angle_rad):.2f}"
+
+def _moving_traces(angle_deg):
+    angle_rad = math.radians(angle_deg)
+    c, s = round(math.cos(angle_rad), 4), round(math.sin(angle_rad), 4)
+    angle_rad = round(angle_rad, 4)
+    return [
+        go.Scatter(x=[0, c], y=[0, s]),
+        go.Scatter(x=[c], y=[s]),
+        go.Scatter(x=[0, c], y=[0, 0]),
+        go.Scatter(x=[c, c], y=[0, s]),
+        go.Scatter(x=[angle_rad], y=[s]),
+    ]
+
+@st.cache_resource
+def _animated_figure(initial_deg=45):
+    # One Plotly frame per integer angle, shipped once: scrubbing the
+    # built-in slider animates in the browser without any rerun. Cached
+    # across sessions, and Streamlit's message cache means a client that
+    # already has the figure only receives its hash on later reruns.
+    x_wave, y_wave = _sine_wave()
+    fig = make_subplots(rows=1, cols=2, subplot_titles=("Interactive Unit Circle", "Sine Wave"))
+    fig.add_trace(go.Scatter(x=x_wave, y=y_wave, mode='lines', name='Sine Wave', line=dict(color='red')), row=1, col=2)
+    arm, point, cos_line, sin_line, wave_point = _moving_traces(initial_deg)
+    fig.add_trace(arm.update(mode='lines+markers', name='Angle Arm', line=dict(color='red')), row=1, col=1)
+    fig.add_trace(point.update(mode='markers', marker=dict(size=10, color='red'), name='Point'), row=1, col=1)
+    fig.add_trace(cos_line.update(mode='lines', line=dict(color='blue', dash='dash'), name='cos(θ)'), row=1, col=1)
+    fig.add_trace(sin_line.update(mode='lines', line=dict(color='green', dash='dash'), name='sin(θ)'), row=1, col=1)
+    fig.add_trace(wave_point.update(mode='markers', marker=dict(size=10), name='Current Point'), row=1, col=2)
+    fig.add_shape(type="circle", xref="x", yref="y", x0=-1, y0=-1, x1=1, y1=1, line_color="lightblue")
+    fig.update_xaxes(range=[-1.5, 1.5], row=1, col=1)
+    fig.update_yaxes(range=[-1.5, 1.5], scaleanchor="x", row=1, col=1)
+    fig.update_xaxes(title_text="Angle (radians)", row=1, col=2)
+    fig.update_yaxes(title_text="Value", row=1, col=2)
+
+    readout = dict(xref="paper", yref="paper", x=0.5, y=-0.25, showarrow=False, font=dict(size=14))
+    fig.frames = [
+        go.Frame(
+            name=str(angle_deg),
+            data=_moving_traces(angle_deg),
+            traces=[1, 2, 3, 4, 5],
+            layout=dict(annotations=list(fig.layout.annotations) + [dict(readout, text=_readout(angle_deg))]),
+        )
+        for angle_deg in range(0, 361)
+    ]
+    fig.update_layout(
+        annotations=list(fig.layout.annotations) + [dict(readout, text=_readout(initial_deg))],
+        margin=dict(b=140),
+        sliders=[dict(
+            active=initial_deg,
+            currentvalue=dict(prefix="θ = ", suffix="°"),
+            pad=dict(t=60),
+            steps=[
+                dict(
+                    label=str(angle_deg),
+                    method="animate",
+                    args=[[str(angle_deg)], dict(mode="immediate", frame=dict(duration=0, redraw=True), transition=dict(duration=0))],
+                )
+                for angle_deg in range(0, 361)
+            ],
+        )],
+    )
+    return fig
 
 def show_trig_ar_unit_circle():
     st.header("AR-Style Unit Circle Simulator")
     st.markdown("""
     Drag the angle arm to explore the unit circle interactively. Watch sine, cosine, and tangent update in real-time, along with the corresponding wave graphs.
     """)
-    
+
+    if st.toggle("Smooth scrubbing (animates in your browser)", key="ar_client_side"):
+        st.plotly_chart(_animated_figure(), use_container_width=True)
+        return
+
     angle_deg = st.slider("Angle (degrees)", 0, 360, 45, key="ar_angle")
     angle_rad = math.radians(angle_deg)
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=[0, math.cos(angle_rad)], y=[0, math.sin(angle_rad)], mode='lines+markers', name='Angle Arm', line=dict(color='red')))
-    fig.add_trace(go.Scatter(x=[math.cos(angle_rad)], y=[math.sin(angle_rad)], mode='markers', marker=dict(size=10, color='red'), name='Point'))
-    fig.add_trace(go.Scatter(x=[0, math.cos(angle_rad)], y=[0, 0], mode='lines', line=dict(color='blue', dash='dash'), name='cos(θ)'))
-    fig.add_trace(go.Scatter(x=[math.cos(angle_rad), math.cos(angle_rad)], y=[0, math.sin(angle_rad)], mode='lines', line=dict(color='green', dash='dash'), name='sin(θ)'))
-    fig.add_shape(type="circle", xref="x", yref="y", x0=-1, y0=-1, x1=1, y1=1, line_color="lightblue")
-    fig.update_layout(xaxis=dict(range=[-1.5, 1.5]), yaxis=dict(range=[-1.5, 1.5]), showlegend=True, title="Interactive Unit Circle")
+    cos_value, sin_value = math.cos(angle_rad), math.sin(angle_rad)
+
+    fig, fig_wave = _session_figures()
+    with fig.batch_update():
+        fig.data[ARM].update(x=[0, cos_value], y=[0, sin_value])
+        fig.data[POINT].update(x=[cos_value], y=[sin_value])
+        fig.data[COS_LINE].update(x=[0, cos_value])
+        fig.data[SIN_LINE].update(x=[cos_value, cos_value], y=[0, sin_value])
     st.plotly_chart(fig)
-    
+
     st.markdown(f"""
-    - Cos(θ) = {math.cos(angle_rad):.2f}
-    - Sin(θ) = {math.sin(angle_rad):.2f}
+    - Cos(θ) = {cos_value:.2f}
+    - Sin(θ) = {sin_value:.2f}
     - Tan(θ) = {math.tan(angle_rad):.2f}
     """)
-    
-    x_wave = np.linspace(0, 2*np.pi, 1000)
-    y_wave = np.sin(x_wave)
-    fig_wave = go.Figure()
-    fig_wave.add_trace(go.Scatter(x=x_wave, y=y_wave, mode='lines', name='Sine Wave', line=dict(color='red')))
-    fig_wave.add_trace(go.Scatter(x=[angle_rad], y=[math.sin(angle_rad)], mode='markers', marker=dict(size=10), name='Current Point'))
-    fig_wave.update_layout(title="Sine Wave", xaxis_title="Angle (radians)", yaxis_title="Value")
+
+    fig_wave.data[1].update(x=[angle_rad], y=[sin_value])
     st.plotly_chart(fig_wave)
@@ -1,11 +1,52 @@
 import streamlit as st
 import math
+from mathbook import batch_trig, triangles
+from mathbook.sessions import note_upload
+
+RIGHT_TRIANGLE = "Right"
+CASE_LABELS = {
+    RIGHT_TRIANGLE: "Right triangle (two legs)",
+    "SSS": "SSS (three sides)",
+    "SAS": "SAS (two sides and the angle between them)",
+    "ASA": "ASA (two angles and the side between them)",
+    "AAS": "AAS (two angles and a side not between them)",
+    "SSA": "SSA (two sides and an angle not between them)",
+}
+PART_LABELS = {
+    "a": "Side a", "b": "Side b", "c": "Side c",
+    "A": "Angle A", "B": "Angle B", "C": "Angle C",
+    "area": "Area", "perimeter": "Perimeter",
+}
+TRIANGLE_DEFAULTS = {
+    "SSS": [3.0, 4.0, 5.0],
+    "SAS": [3.0, 90.0, 4.0],
+    "ASA": [30.0, 10.0, 60.0],
+    "AAS": [30.0, 60.0, 5.0],
+    "SSA": [6.0, 8.0, 35.0],
+}
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _run_batch(mode, data):
+    return batch_trig.run_batch(mode, data)
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _solve_batch(case, data):
+    return triangles.run_batch(case, data)
+
+def _show_batch_result(csv_bytes, rows, flagged, preview, file_name):
+    st.markdown(f"Computed {rows:,} rows, {flagged:,} flagged.")
+    if preview:
+        header = " | ".join(preview)
+        divider = " | ".join("---" for _ in preview)
+        lines = [" | ".join(row) for row in zip(*preview.values())]
+        st.markdown("\n".join([f"| {header} |", f"| {divider} |"] + [f"| {line} |" for line in lines]))
+    st.download_button("Download Results CSV", csv_bytes, file_name, "text/csv")
 
 def show_trig_calculator():
     st.header("Trig Calculator")
     st.markdown("Use this tool to calculate trig values or solve triangles. Verify your homework here!")
 
-    calc_type = st.selectbox("Choose Calculation Type", ["Basic Trig Functions", "Inverse Trig Functions", "Triangle Solver"])
+    calc_type = st.selectbox("Choose Calculation Type", ["Basic Trig Functions", "Inverse Trig Functions", "Triangle Solver", "Batch Mode"])
 
     if calc_type == "Basic Trig Functions":
         angle = st.number_input("Enter angle in degrees", value=0.0)
@@ -28,13 +69,58 @@ def show_trig_calculator():
             st.error("Value must be between -1 and 1 for arcsin and arccos.")
 
     elif calc_type == "Triangle Solver":
-        st.subheader("Right Triangle Solver")
-        side_a = st.number_input("Side A (opposite to angle A)", value=0.0)
-        side_b = st.number_input("Side B (adjacent to angle A)", value=0.0)
-        if side_a and side_b:
-            hypotenuse = math.sqrt(side_a**2 + side_b**2)
-            angle_a = math.degrees(math.atan(side_a / side_b))
-            st.markdown(f"""
-            - Hypotenuse: {hypotenuse:.4f}
-            - Angle A: {angle_a:.4f}°
-            """)
+        case = st.selectbox("Known parts", [RIGHT_TRIANGLE] + list(triangles.CASES), format_func=lambda c: CASE_LABELS.get(c, c), key="triangle_case")
+        if case == RIGHT_TRIANGLE:
+            st.subheader("Right Triangle Solver")
+            side_a = st.number_input("Side A (opposite to angle A)", value=0.0)
+            side_b = st.number_input("Side B (adjacent to angle A)", value=0.0)
+            if side_a and side_b:
+                hypotenuse = math.sqrt(side_a**2 + side_b**2)
+                angle_a = math.degrees(math.atan(side_a / side_b))
+                st.markdown(f"""
+                - Hypotenuse: {hypotenuse:.4f}
+                - Angle A: {angle_a:.4f}°
+                """)
+        else:
+            st.subheader(f"{case} Triangle Solver")
+            st.markdown("Sides a, b, c are opposite angles A, B, C.")
+            given = [
+                st.number_input(PART_LABELS[name] + ("" if name.islower() else " (degrees)"), value=TRIANGLE_DEFAULTS[case][i], key=f"triangle_{case}_{name}")
+                for i, name in enumerate(triangles.CASES[case])
+            ]
+            first, second, flags = triangles.solve(case, *([v] for v in given))
+            if math.isnan(first["a"][0]):
+                st.error(f"No triangle: {flags[0]}.")
+            else:
+                if flags[0]:
+                    st.info("Two triangles have these parts (the ambiguous case).")
+                for number, solution in enumerate((first, second), 1):
+                    if math.isnan(solution["a"][0]):
+                        continue
+                    if flags[0]:
+                        st.markdown(f"**Triangle {number}**")
+                    st.markdown("\n".join(f"- {PART_LABELS[name]}: {solution[name][0]:.4f}{'°' if name.isupper() else ''}" for name in triangles.PARTS))
+
+            st.markdown("#### Solve many at once")
+            st.markdown(f"Upload a CSV (or paste lines) with {', '.join(triangles.CASES[case])} in the first three columns.")
+            uploaded_file = st.file_uploader("Upload a CSV", type=["csv", "txt"], key="triangle_upload")
+            note_upload("triangle_upload", uploaded_file)
+            pasted = st.text_area("...or paste triangles", key="triangle_paste")
+            data = uploaded_file.getvalue() if uploaded_file else pasted
+            if data:
+                with st.spinner("Solving..."):
+                    csv_bytes, rows, flagged, preview = _solve_batch(case, data)
+                _show_batch_result(csv_bytes, rows, flagged, preview, f"triangles_{case}.csv")
+
+    elif calc_type == "Batch Mode":
+        st.subheader("Batch Mode")
+        st.markdown("Check a whole answer sheet at once: upload a CSV (first column is used) or paste one value per line.")
+        mode = st.radio("Input values", [batch_trig.ANGLES, batch_trig.RATIOS], key="batch_mode")
+        uploaded_file = st.file_uploader("Upload a CSV", type=["csv", "txt"], key="batch_upload")
+        note_upload("batch_upload", uploaded_file)
+        pasted = st.text_area("...or paste values", key="batch_paste")
+        data = uploaded_file.getvalue() if uploaded_file else pasted
+        if data:
+            with st.spinner("Computing..."):
+                csv_bytes, rows, flagged, preview = _run_batch(mode, data)
+            _show_batch_result(csv_bytes, rows, flagged, preview, "trig_batch_results.csv")
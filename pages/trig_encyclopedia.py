@@ -1,7 +1,40 @@
 import streamlit as st
 import math
-import matplotlib.pyplot as plt
-from matplotlib.patches import Arc
+from mathbook.encyclopedia_frames import get_frame_cache
+from mathbook.render_pool import get_render_pool, show_rendered
+from mathbook.right_triangle import show_right_triangle
+from mathbook.sampling import adaptive_sample
+
+def _draw_graphs(fig):
+    import numpy as np
+    # Each panel is about 1240x560 px once rendered at 200 dpi
+    panel = dict(width_px=1240, height_px=560)
+    x_sin, y_sin = adaptive_sample(np.sin, 0, 2*np.pi, (-1.1, 1.1), **panel)
+    x_cos, y_cos = adaptive_sample(np.cos, 0, 2*np.pi, (-1.1, 1.1), **panel)
+    x_tan, y_tan = adaptive_sample(np.tan, 0, 2*np.pi, (-10, 10), **panel)
+    ax_graph = fig.subplots(3, 1)
+
+    ax_graph[0].plot(x_sin, y_sin, color='red')
+    ax_graph[0].set_title('Sine Function', color='red')
+    ax_graph[0].grid(True)
+
+    ax_graph[1].plot(x_cos, y_cos, color='blue')
+    ax_graph[1].set_title('Cosine Function', color='blue')
+    ax_graph[1].grid(True)
+
+    ax_graph[2].plot(x_tan, y_tan, color='green')
+    ax_graph[2].set_title('Tangent Function', color='green')
+    ax_graph[2].set_ylim(-10, 10)
+    ax_graph[2].grid(True)
+
+    fig.tight_layout()
+
+@st.cache_resource(show_spinner=False)
+def _graphs_png():
+    # The graphs take no inputs: draw them once, not on every rerun. The
+    # PNG is immutable bytes, so every session can share this one copy
+    # rather than unpickling its own from st.cache_data
+    return get_render_pool().render(_draw_graphs, figsize=(8, 12))
 
 def show_trig_encyclopedia():
     st.header("Trigonometry Encyclopedia")
@@ -34,19 +67,7 @@ def show_trig_encyclopedia():
         opposite = math.sin(angle_rad) * hypotenuse
         adjacent = math.cos(angle_rad) * hypotenuse
         
-        fig, ax = plt.subplots()
-        ax.plot([0, adjacent], [0, 0], 'b-', linewidth=2)
-        ax.plot([adjacent, adjacent], [0, opposite], 'g-', linewidth=2)
-        ax.plot([0, adjacent], [0, opposite], 'r-', linewidth=2)
-        ax.text(adjacent/2, -0.05, 'Adjacent', color='b')
-        ax.text(adjacent + 0.01, opposite/2, 'Opposite', color='g')
-        ax.text(adjacent/2, opposite/2, 'Hypotenuse', color='r')
-        ax.add_patch(Arc((0,0), 0.2, 0.2, theta1=0, theta2=angle_deg, color='purple'))
-        ax.text(0.1, 0.05, f'θ = {angle_deg}°', color='purple')
-        ax.set_xlim(0, 1.1)
-        ax.set_ylim(0, 1.1)
-        ax.axis('off')
-        st.pyplot(fig)
+        show_right_triangle(angle_deg, labels=('Adjacent', 'Opposite', 'Hypotenuse'), extent=1.1, hypotenuse=hypotenuse)
         
         st.markdown(f"""
         - Sin(θ) = {opposite:.2f}
@@ -71,21 +92,7 @@ def show_trig_encyclopedia():
         angle_deg_unit = st.slider("Adjust the angle (θ in degrees)", 0, 360, 45, key="uc_angle")
         angle_rad_unit = math.radians(angle_deg_unit)
         
-        fig_unit, ax_unit = plt.subplots()
-        circle = plt.Circle((0, 0), 1, color='lightblue', fill=False)
-        ax_unit.add_patch(circle)
-        ax_unit.plot([0, math.cos(angle_rad_unit)], [0, math.sin(angle_rad_unit)], 'r-')
-        ax_unit.plot([math.cos(angle_rad_unit), math.cos(angle_rad_unit)], [0, math.sin(angle_rad_unit)], 'g--')
-        ax_unit.plot([0, math.cos(angle_rad_unit)], [0, 0], 'b--')
-        ax_unit.text(0.5, -0.1, 'cos(θ)', color='b')
-        ax_unit.text(math.cos(angle_rad_unit) + 0.01, math.sin(angle_rad_unit)/2, 'sin(θ)', color='g')
-        ax_unit.add_patch(Arc((0,0), 0.5, 0.5, theta1=0, theta2=angle_deg_unit if angle_deg_unit <= 180 else angle_deg_unit - 360, color='purple'))
-        ax_unit.text(0.2, 0.1, f'θ = {angle_deg_unit}°', color='purple')
-        ax_unit.set_xlim(-1.2, 1.2)
-        ax_unit.set_ylim(-1.2, 1.2)
-        ax_unit.set_aspect('equal')
-        ax_unit.axis('off')
-        st.pyplot(fig_unit)
+        st.image(get_frame_cache().get("unit_circle", angle_deg_unit), use_column_width=True)
         
         st.markdown(f"""
         - Cos(θ) = {math.cos(angle_rad_unit):.2f}
@@ -108,25 +115,7 @@ def show_trig_encyclopedia():
         ### Visualization: Graphs
         """)
         
-        import numpy as np
-        x = np.linspace(0, 2*np.pi, 1000)
-        fig_graph, ax_graph = plt.subplots(3, 1, figsize=(8, 12))
-        
-        ax_graph[0].plot(x, np.sin(x), color='red')
-        ax_graph[0].set_title('Sine Function', color='red')
-        ax_graph[0].grid(True)
-        
-        ax_graph[1].plot(x, np.cos(x), color='blue')
-        ax_graph[1].set_title('Cosine Function', color='blue')
-        ax_graph[1].grid(True)
-        
-        ax_graph[2].plot(x, np.tan(x), color='green')
-        ax_graph[2].set_title('Tangent Function', color='green')
-        ax_graph[2].set_ylim(-10, 10)
-        ax_graph[2].grid(True)
-        
-        plt.tight_layout()
-        st.pyplot(fig_graph)
+        show_rendered(_graphs_png)
 
     with st.expander("4. Trigonometric Identities"):
         st.markdown("""
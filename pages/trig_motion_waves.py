@@ -1 +1,101 @@
+import streamlit as st
+import numpy as np
+from mathbook import audio, projectiles
+from mathbook.render_pool import get_render_pool, show_figure, show_rendered
+from mathbook.sampling import adaptive_sample
 
+SWEEP_METRICS = {
+    "Range": ("range", "m"),
+    "Apex height": ("apex", "m"),
+    "Flight time": ("flight_time", "s"),
+}
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _sweep(angle_range, velocity_range, resolution, drag):
+    return projectiles.sweep(np.linspace(*angle_range, resolution), np.linspace(*velocity_range, resolution), drag)
+
+def _draw_heat_map(fig, sweep_velocities, sweep_angles, surface, best, metric):
+    ax = fig.subplots()
+    mesh = ax.pcolormesh(sweep_velocities, sweep_angles, surface, shading='auto', cmap='viridis')
+    fig.colorbar(mesh, ax=ax, label=f"{metric} ({SWEEP_METRICS[metric][1]})")
+    ax.plot(sweep_velocities, best, 'w--', label='Farthest range')
+    ax.set_xlabel('Initial velocity (m/s)')
+    ax.set_ylabel('Launch angle (degrees)')
+    ax.set_title(f'{metric} over angle × velocity')
+    ax.legend(loc='upper right')
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _sweep_heat_map(angle_range, velocity_range, resolution, drag, metric):
+    sweep_angles = np.linspace(*angle_range, resolution)
+    sweep_velocities = np.linspace(*velocity_range, resolution)
+    surfaces = _sweep(angle_range, velocity_range, resolution, drag)
+    best = sweep_angles[np.argmax(surfaces["range"], axis=0)]
+    return get_render_pool().render(
+        _draw_heat_map, sweep_velocities, sweep_angles, surfaces[SWEEP_METRICS[metric][0]], best, metric,
+    )
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _tone(freq, duration, harmonics):
+    return audio.tone_wav(freq, duration, harmonics)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _trajectories(angles, velocity, drag):
+    return projectiles.trajectories(angles, velocity, drag)
+
+def _draw_motion(fig, angles, paths, legend):
+    ax_motion = fig.subplots()
+    for i, (angle, (x, y)) in enumerate(zip(angles, paths)):
+        ax_motion.plot(x, y, 'r-' if i == 0 else '-', linewidth=2 if i == 0 else 1, label=f"{angle}°")
+    ax_motion.set_title('Projectile Motion')
+    ax_motion.set_xlabel('Horizontal Distance (m)')
+    ax_motion.set_ylabel('Height (m)')
+    if legend:
+        ax_motion.legend()
+    ax_motion.grid(True)
+
+def _draw_wave(fig, freq, harmonics):
+    t_wave, y_wave = adaptive_sample(lambda t: audio.waveform(t, freq, harmonics), 0, 0.01, (-1.1, 1.1))
+    ax_wave = fig.subplots()
+    ax_wave.plot(t_wave, y_wave, 'b-')
+    ax_wave.set_title('Sound Wave')
+    ax_wave.set_xlabel('Time (s)')
+    ax_wave.set_ylabel('Amplitude')
+    ax_wave.grid(True)
+
+def show_trig_motion_waves():
+    st.header("Projectile Motion & Wave Animations")
+    st.markdown("Adjust parameters to see how trig models motion and waves.")
+    
+    angle_deg = st.slider("Launch angle (degrees)", 0, 90, 45, key="motion_angle")
+    velocity = st.number_input("Initial velocity (m/s)", value=10.0)
+    drag = st.slider("Air drag coefficient k (1/m)", 0.0, 0.1, 0.0, 0.005, key="motion_drag")
+    compare = st.multiselect("Compare with other launch angles", list(range(5, 90, 5)), key="motion_compare")
+
+    angles = [angle_deg] + [a for a in compare if a != angle_deg]
+    paths = _trajectories(tuple(angles), velocity, drag)
+    flight = projectiles.sweep([angle_deg], [velocity], drag)
+
+    show_figure(_draw_motion, tuple(angles), paths, bool(compare))
+    st.markdown(f"""
+    - Range: {flight["range"][0, 0]:.2f} m
+    - Maximum height: {flight["apex"][0, 0]:.2f} m
+    - Flight time: {flight["flight_time"][0, 0]:.2f} s
+    """)
+
+    st.subheader("Parameter Sweep")
+    st.markdown("Every launch angle against every speed at once. The dashed line marks the angle that throws farthest at each speed; with drag it drops below 45°.")
+    angle_range = st.slider("Launch angles (degrees)", 1, 89, (5, 85), key="sweep_angles")
+    velocity_range = st.slider("Velocities (m/s)", 1, 100, (5, 50), key="sweep_velocities")
+    resolution = st.select_slider("Grid resolution", [25, 50, 100, 200], 100, key="sweep_resolution")
+    metric = st.radio("Show", list(SWEEP_METRICS), horizontal=True, key="sweep_metric")
+
+    # The heat map only depends on the sweep settings, so moving the launch
+    # angle above reuses the rendered image
+    show_rendered(_sweep_heat_map, angle_range, velocity_range, resolution, drag, metric)
+
+    st.subheader("Sound Wave")
+    freq = st.slider("Frequency (Hz)", 100, 1000, 440)
+    harmonics = st.slider("Harmonics", 1, 16, 1, key="wave_harmonics")
+    duration = st.slider("Duration (s)", 1, 30, 2, key="wave_duration")
+    show_figure(_draw_wave, freq, harmonics)
+    st.audio(_tone(freq, duration, harmonics), format="audio/wav")
@@ -1,7 +1,7 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
-from matplotlib.patches import Arc
+import math
+from mathbook.right_triangle import show_right_triangle
+from mathbook.static_assets import asset
 
 def show_trig_real_world():
     st.header("Real-World Applications of Trigonometry")
@@ -23,18 +23,7 @@ def show_trig_real_world():
         ### Visualization:
         Imagine a right triangle where the opposite side is the building height, adjacent is the ground distance, and θ is the angle.
         """)
-        fig_arch, ax_arch = plt.subplots()
-        ax_arch.plot([0, 5], [0, 0], 'b-')
-        ax_arch.plot([5, 5], [0, 4], 'g-')
-        ax_arch.plot([0, 5], [0, 4], 'r-')
-        ax_arch.add_patch(Arc((0,0), 1, 1, theta1=0, theta2=np.degrees(np.atan(4/5)), color='purple'))
-        ax_arch.text(0.5, 0.1, 'θ', color='purple')
-        ax_arch.text(2.5, -0.2, 'Distance', color='b')
-        ax_arch.text(5.1, 2, 'Height', color='g')
-        ax_arch.set_xlim(0, 6)
-        ax_arch.set_ylim(0, 5)
-        ax_arch.axis('off')
-        st.pyplot(fig_arch)
+        show_right_triangle(math.degrees(math.atan(4/5)), 5, labels=('Distance', 'Height', None), angle_label='θ')
 
     with st.expander("2. Physics and Engineering"):
         st.markdown("""
@@ -46,18 +35,7 @@ def show_trig_real_world():
         
         **Example:** A ball thrown at an angle θ has initial velocity split as v_x = v * cos(θ), v_y = v * sin(θ).
         """)
-        t = np.linspace(0, 2, 100)
-        vx = 5 * np.cos(np.pi/4)
-        vy = 5 * np.sin(np.pi/4) - 9.8 * t
-        x = vx * t
-        y = 5 * np.sin(np.pi/4) * t - 0.5 * 9.8 * t**2
-        fig_phys, ax_phys = plt.subplots()
-        ax_phys.plot(x, y, 'r-')
-        ax_phys.set_title('Projectile Motion')
-        ax_phys.set_xlabel('Horizontal Distance')
-        ax_phys.set_ylabel('Vertical Height')
-        ax_phys.grid(True)
-        st.pyplot(fig_phys)
+        st.image(asset("real_world", "projectile"), use_column_width=True)
 
     with st.expander("3. Astronomy and Navigation"):
         st.markdown("""
@@ -98,15 +76,9 @@ def show_trig_real_world():
         
         **Example:** A musical note's waveform is y = A * sin(2πft), where f is frequency.
         """)
-        t_sound = np.linspace(0, 0.01, 1000)
-        y_sound = np.sin(2 * np.pi * 440 * t_sound)
-        fig_sound, ax_sound = plt.subplots()
-        ax_sound.plot(t_sound, y_sound, 'b-')
-        ax_sound.set_title('Sine Wave for Sound')
-        ax_sound.set_xlabel('Time')
-        ax_sound.set_ylabel('Amplitude')
-        ax_sound.grid(True)
-        st.pyplot(fig_sound)
+        st.image(asset("real_world", "sound_wave"), use_column_width=True)
+        st.markdown("Listen to it: A4, 440 Hz.")
+        st.audio(asset("real_world", "a440", "wav"), format="audio/wav")
 
     with st.expander("7. Surveying and Geography"):
         st.markdown("""
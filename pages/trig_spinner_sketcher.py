@@ -0,0 +1,34 @@
+import streamlit as st
+import math
+import numpy as np
+from mathbook.diagrams import Diagram, show
+
+def _diagram(angle_deg):
+    angle_rad = math.radians(angle_deg)
+    return (
+        Diagram((-1.2, 1.2), (-1.2, 1.2), equal=True)
+        .circle(0, 0, 1, 'lightblue')
+        .segment(0, 0, math.cos(angle_rad), math.sin(angle_rad), 'r')
+    )
+
+def show_trig_spinner_sketcher():
+    st.header("Paper Plate Spinner & Angle Sketcher")
+    st.markdown("Spin the wheel to get a random angle, then sketch it in standard position.")
+    
+    if 'random_angle' not in st.session_state:
+        st.session_state.random_angle = 0
+    
+    if st.button("Spin Wheel"):
+        st.session_state.random_angle = np.random.randint(0, 360)
+    
+    angle_deg = st.session_state.random_angle
+    
+    show(_diagram(angle_deg))
+    
+    st.markdown(f"Angle: {angle_deg}°")
+    coterminal = st.number_input("Enter a coterminal angle (degrees)", key="coterm")
+    if st.button("Check Coterminal"):
+        if (coterminal % 360) == (angle_deg % 360):
+            st.success("Correct coterminal angle!")
+        else:
+            st.error("Try again!")
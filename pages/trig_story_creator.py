@@ -1,56 +1,72 @@
 import streamlit as st
 import math
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 import io
 from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
+from mathbook.images import encode_image, image_digest, load_base_image
+from mathbook.pdf_jobs import pdf_button
+from mathbook.sessions import cached, note_upload
+
+def _build_story_pdf(angle_deg, opposite, side_adj, overlay_bytes):
+    pdf_buffer = io.BytesIO()
+    c = canvas.Canvas(pdf_buffer, pagesize=letter)
+    c.drawString(100, 750, "Trigonometry Story")
+    c.drawString(100, 730, f"Scenario: Analyzed a real-life triangle with angle {angle_deg}°")
+    c.drawString(100, 710, f"Opposite: {opposite:.2f}, Adjacent: {side_adj:.2f}")
+    c.drawImage(ImageReader(io.BytesIO(overlay_bytes)), 100, 400, width=200, height=200)
+    c.showPage()
+    c.save()
+    return pdf_buffer.getvalue()
 
 def show_trig_story_creator():
     st.header("Digital Storytelling Project Builder")
     st.markdown("""
     Upload a photo of a real-life scenario (e.g., a slide or shadow), draw a triangle, and calculate trig values. Download your story as a PDF.
     """)
-    
+
     uploaded_file = st.file_uploader("Upload an image", type=["png", "jpg", "jpeg"])
+    note_upload("story_image", uploaded_file)
     if uploaded_file:
-        image = Image.open(uploaded_file)
-        st.image(image, caption="Uploaded Scenario")
-        
+        data = uploaded_file.getvalue()
+        digest = image_digest(data)
+        # Decoded once per upload and kept with this session, so it counts
+        # against the session's memory budget and goes when the tab idles
+        base_image, original_size = cached(("story_base", digest), lambda: load_base_image(data), category="decoded_images")
+        st.image(cached(("story_preview", digest), lambda: encode_image(base_image)), caption="Uploaded Scenario")
+
         angle_deg = st.number_input("Angle of triangle (degrees)", value=30.0, key="story_angle")
         side_adj = st.number_input("Adjacent side length", value=5.0)
         angle_rad = math.radians(angle_deg)
         opposite = side_adj * math.tan(angle_rad)
-        
+
+        # The cached base image is shared, so draw on a copy; lengths are
+        # scaled so the triangle sits where it would on the full-size photo
+        image = base_image.copy()
+        scale = image.size[0] / original_size[0]
         draw = ImageDraw.Draw(image)
         width, height = image.size
         x1, y1 = width * 0.2, height * 0.8
-        x2, y2 = x1 + side_adj * 20, y1
-        x3, y3 = x2, y1 - opposite * 20
+        x2, y2 = x1 + side_adj * 20 * scale, y1
+        x3, y3 = x2, y1 - opposite * 20 * scale
         draw.line([(x1, y1), (x2, y2)], fill='blue', width=2)
         draw.line([(x2, y2), (x3, y3)], fill='green', width=2)
         draw.line([(x1, y1), (x3, y3)], fill='red', width=2)
         draw.text((x1 + 10, y1 - 20), f'θ = {angle_deg}°', fill='purple')
-        
-        buf = io.BytesIO()
-        image.save(buf, format="PNG")
-        st.image(buf, caption="Triangle Overlay")
-        
+
+        # One encoded buffer for both the preview and the PDF
+        overlay_bytes = encode_image(image)
+        st.image(overlay_bytes, caption="Triangle Overlay")
+
         st.markdown(f"""
         - Opposite: {opposite:.2f}
         - Adjacent: {side_adj:.2f}
         - Hypotenuse: {math.sqrt(opposite**2 + side_adj**2):.2f}
         """)
-        
-        if st.button("Generate Story PDF"):
-            pdf_buffer = io.BytesIO()
-            c = canvas.Canvas(pdf_buffer, pagesize=letter)
-            c.drawString(100, 750, "Trigonometry Story")
-            c.drawString(100, 730, f"Scenario: Analyzed a real-life triangle with angle {angle_deg}°")
-            c.drawString(100, 710, f"Opposite: {opposite:.2f}, Adjacent: {side_adj:.2f}")
-            img_buf = io.BytesIO()
-            image.save(img_buf, format="PNG")
-            c.drawImage(reportlab.lib.utils.ImageReader(img_buf), 100, 400, width=200, height=200)
-            c.showPage()
-            c.save()
-            pdf_buffer.seek(0)
-            st.download_button("Download Story PDF", pdf_buffer, "story.pdf", "application/pdf")
+
+        pdf_button(
+            "Generate Story PDF", ("story", digest, angle_deg, side_adj),
+            _build_story_pdf, angle_deg, opposite, side_adj, overlay_bytes,
+            download_label="Download Story PDF", file_name="story.pdf",
+        )
@@ -0,0 +1,195 @@
+"""Prerender parameter-free diagrams and sounds to static SVG/PNG/WAV assets.
+
+    python tools/build_assets.py           # (re)build mathbook/assets/ and its manifests
+    python tools/build_assets.py --check   # exit non-zero if the assets are out of date
+
+The diagrams and sounds below have no inputs, so pages serve the files
+listed in each group's manifest.json (see mathbook.static_assets) instead
+of drawing them with matplotlib or synthesizing them with numpy on every
+rerun. Edit a diagram here, rebuild and commit the
+output; --check compares the manifest against a hash of SOURCES, this
+file and the mathbook modules the assets are generated with.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSET_DIR = os.path.join(ROOT, "mathbook", "assets")
+sys.path.insert(0, ROOT)
+
+# Same raster density as st.pyplot
+PNG_DPI = 200
+
+
+def projectile(ax):
+    import numpy as np
+
+    t = np.linspace(0, 2, 100)
+    x = 5 * np.cos(np.pi/4) * t
+    y = 5 * np.sin(np.pi/4) * t - 0.5 * 9.8 * t**2
+    ax.plot(x, y, 'r-')
+    ax.set_title('Projectile Motion')
+    ax.set_xlabel('Horizontal Distance')
+    ax.set_ylabel('Vertical Height')
+    ax.grid(True)
+
+
+def sound_wave(ax):
+    import numpy as np
+
+    t_sound = np.linspace(0, 0.01, 1000)
+    y_sound = np.sin(2 * np.pi * 440 * t_sound)
+    ax.plot(t_sound, y_sound, 'b-')
+    ax.set_title('Sine Wave for Sound')
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Amplitude')
+    ax.grid(True)
+
+
+def a440():
+    from mathbook.audio import tone_wav
+
+    return tone_wav(440, 2)
+
+
+DIAGRAMS = {
+    "real_world": {
+        "projectile": projectile,
+        "sound_wave": sound_wave,
+    },
+}
+
+SOUNDS = {
+    "real_world": {
+        "a440": a440,
+    },
+}
+
+
+# Code the assets are generated with: this file and the mathbook modules
+# that synthesize sounds and draw diagrams. Changing any of them marks the
+# committed assets stale
+SOURCES = [
+    "tools/build_assets.py",
+    "mathbook/audio.py",
+    "mathbook/diagrams.py",
+    "mathbook/right_triangle.py",
+]
+
+
+def _source_hash():
+    digest = hashlib.sha256()
+    for path in SOURCES:
+        with open(os.path.join(ROOT, path), "rb") as f:
+            digest.update(path.encode("utf-8") + b"\0" + f.read())
+    return digest.hexdigest()
+
+
+def render(draw):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from PIL import Image
+
+    fig, ax = plt.subplots()
+    try:
+        draw(ax)
+        # Text stays text and no timestamp, so rebuilds are byte-identical
+        svg = io.BytesIO()
+        with matplotlib.rc_context({"svg.fonttype": "none", "svg.hashsalt": "mathbook"}):
+            fig.savefig(svg, format="svg", bbox_inches="tight", metadata={"Date": None})
+        png = io.BytesIO()
+        fig.savefig(png, format="png", dpi=PNG_DPI, bbox_inches="tight")
+    finally:
+        plt.close(fig)
+
+    # Line art on white fits in a 256-colour palette with no visible loss
+    image = Image.open(png).convert("RGB")
+    optimized = io.BytesIO()
+    image.quantize(256).save(optimized, format="PNG", optimize=True)
+    return svg.getvalue(), optimized.getvalue(), image.size
+
+
+def build_group(group, diagrams, sounds):
+    directory = os.path.join(ASSET_DIR, group)
+    os.makedirs(directory, exist_ok=True)
+    entries = {}
+    for name, draw in diagrams.items():
+        svg, png, (width, height) = render(draw)
+        for ext, data in (("svg", svg), ("png", png)):
+            with open(os.path.join(directory, f"{name}.{ext}"), "wb") as f:
+                f.write(data)
+        entries[name] = {
+            "svg": f"{name}.svg",
+            "png": f"{name}.png",
+            "width": width,
+            "height": height,
+            "svg_bytes": len(svg),
+            "png_bytes": len(png),
+        }
+    for name, synthesize in sounds.items():
+        wav = synthesize()
+        with open(os.path.join(directory, f"{name}.wav"), "wb") as f:
+            f.write(wav)
+        entries[name] = {"wav": f"{name}.wav", "wav_bytes": len(wav)}
+    manifest = {"source_sha256": _source_hash(), "assets": entries}
+    with open(os.path.join(directory, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return entries
+
+
+def check():
+    stale = []
+    for group in sorted(set(DIAGRAMS) | set(SOUNDS)):
+        expected = {name: ("svg", "png") for name in DIAGRAMS.get(group, {})}
+        expected.update({name: ("wav",) for name in SOUNDS.get(group, {})})
+        path = os.path.join(ASSET_DIR, group, "manifest.json")
+        try:
+            with open(path) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            stale.append(f"{group}: no manifest")
+            continue
+        if manifest["source_sha256"] != _source_hash():
+            stale.append(f"{group}: built from different sources ({', '.join(SOURCES)})")
+        for name, exts in expected.items():
+            entry = manifest["assets"].get(name)
+            if entry is None:
+                stale.append(f"{group}/{name}: missing from manifest")
+                continue
+            for ext in exts:
+                if not os.path.exists(os.path.join(ASSET_DIR, group, entry[ext])):
+                    stale.append(f"{group}/{entry[ext]}: missing")
+    return stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only verify the assets are up to date")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = check()
+        for line in stale:
+            print("STALE", line)
+        if stale:
+            print("Run python tools/build_assets.py and commit the result.")
+        return 1 if stale else 0
+
+    for group in sorted(set(DIAGRAMS) | set(SOUNDS)):
+        for name, entry in build_group(group, DIAGRAMS.get(group, {}), SOUNDS.get(group, {})).items():
+            if "wav" in entry:
+                print(f"{group}/{name}: wav {entry['wav_bytes'] / 1024:.1f} KB")
+                continue
+            print(f"{group}/{name}: svg {entry['svg_bytes'] / 1024:.1f} KB, "
+                  f"png {entry['png_bytes'] / 1024:.1f} KB ({entry['width']}x{entry['height']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
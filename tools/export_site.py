@@ -0,0 +1,404 @@
+"""Export the read-only pages, at every value of their sliders, as a static site.
+
+    python tools/export_site.py                          # write site/ with one HTML file per page
+    python tools/export_site.py -o /srv/mathbook --workers 8 --live-url https://mathbook.example.org/
+    python tools/export_site.py -k encyclopedia          # only pages whose id contains a substring
+
+Every page is rendered headlessly through Streamlit's AppTest, once at its
+defaults and once for every value of each slider listed in SWEEPS (the
+slider's own min/max/step give the values; every other widget stays at
+its default). The sweeps are split into chunks and rendered in a process
+pool. Images, audio and Plotly figures are written once each, named by
+content hash, under assets/. Page blocks that change with a slider are
+stored per value in the page, and a range input swaps them client-side,
+so nginx (or any static host) can serve the whole site with no Python
+running. Markdown and math are rendered in the browser (marked, KaTeX),
+like Streamlit itself does. Widgets that are not swept show their
+default value with a link to the live app (--live-url). Pages in
+LIVE_ONLY (calculators, quizzes, uploads) are not exported.
+"""
+import argparse
+import base64
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Warm-up and render-pool workers would compete with the export's own pool
+# (and keep its workers from exiting); draw everything inline instead
+os.environ["MATHBOOK_WARM_FRAMES"] = "0"
+os.environ["MATHBOOK_RENDER_WORKERS"] = "0"
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from mathbook import workers  # noqa: E402
+from mathbook.registry import PAGES  # noqa: E402
+from streamlit.testing.v1.element_tree import Block, Expander  # noqa: E402
+
+# Slider keys whose every value is exported, by page
+SWEEPS = {
+    "Encyclopedia": ["rt_angle", "uc_angle"],
+    "AR Unit Circle": ["ar_angle"],
+    "Radian Crafts": ["craft_sectors"],
+    "Geometry": ["polygon_sides"],
+    # Range sliders, the grid select_slider and the unkeyed frequency slider
+    # stay at their defaults; so does the tone's duration, which only makes
+    # the same sound longer (30 WAVs of up to 30 s each)
+    "Motion & Waves": ["motion_angle", "motion_drag", "wave_harmonics"],
+}
+# Interactive tools that only make sense in the live app
+LIVE_ONLY = {"Trig Calculator", "Quiz", "Story Creator", "Puzzles & Games"}
+
+# Slider values rendered per pool task
+CHUNK = 24
+TIMEOUT = 120
+
+MEDIA_EXTENSIONS = {"image/png": ".png", "image/jpeg": ".jpg", "image/svg+xml": ".svg", "audio/wav": ".wav", "audio/x-wav": ".wav"}
+
+# Filled in by _capture_media() inside the AppTest run, in whichever
+# process is rendering
+_media = {}
+
+
+def _page_app(page_id):
+    # Runs as its own script inside AppTest, so imports live in here
+    from mathbook.registry import PAGES_BY_ID
+    from tools import export_site
+
+    PAGES_BY_ID[page_id].show()
+    export_site._capture_media()
+
+
+def _capture_media():
+    # AppTest's mock runtime, and its in-memory media store, only live for
+    # the duration of one run
+    from streamlit import runtime
+
+    storage = runtime.get_instance().media_file_mgr._storage
+    for file_id, media in storage._files_by_id.items():
+        _media[file_id] = (media.content, media.mimetype)
+
+
+def slug(page_id):
+    return re.sub(r"[^a-z0-9]+", "-", page_id.lower()).strip("-")
+
+
+class Assets:
+    """Content-addressed files for one rendered state, written out by the parent."""
+
+    def __init__(self):
+        self.files = {}
+
+    def add(self, data, extension):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        name = hashlib.sha256(data).hexdigest()[:20] + extension
+        self.files[name] = data
+        return f"assets/{name}"
+
+
+def _media_url(url, assets):
+    if url.startswith("data:"):
+        header, _, payload = url[5:].partition(",")
+        mimetype = header.split(";")[0]
+        data = base64.b64decode(payload) if header.endswith(";base64") else payload.encode("utf-8")
+        return assets.add(data, MEDIA_EXTENSIONS.get(mimetype, ""))
+    file_id = os.path.splitext(os.path.basename(url))[0]
+    content, mimetype = _media[file_id]
+    return assets.add(content, MEDIA_EXTENSIONS.get(mimetype, os.path.splitext(url)[1]))
+
+
+def _widget(node, live_url):
+    value = node.value
+    shown = (", ".join(map(str, value)) or "none") if isinstance(value, (list, tuple)) else str(value)
+    link = f' <a href="{html.escape(live_url)}">change it in the live app</a>' if live_url else ""
+    return {
+        "key": getattr(node, "key", None),
+        "label": node.label,
+        "value": value,
+        "html": f'<p class="widget">{html.escape(node.label)}: <b>{html.escape(shown)}</b>{link}</p>',
+    }
+
+
+def _leaves(node, assets, live_url, out):
+    """Flatten an element tree into ("leaf" | "widget" | "markup", content) items."""
+    kind = node.type
+    if isinstance(node, Expander):
+        out.append(("markup", f"<details><summary>{html.escape(node.label)}</summary>"))
+        for child in node.children.values():
+            _leaves(child, assets, live_url, out)
+        out.append(("markup", "</details>"))
+    elif isinstance(node, Block):
+        for child in node.children.values():
+            _leaves(child, assets, live_url, out)
+    elif kind in ("title", "header", "subheader"):
+        tag = {"title": "h1", "header": "h2", "subheader": "h3"}[kind]
+        out.append(("leaf", f"<{tag}>{html.escape(node.value)}</{tag}>"))
+    elif kind in ("markdown", "caption"):
+        out.append(("leaf", f'<div class="md {kind}">{html.escape(node.value)}</div>'))
+    elif kind in ("error", "warning", "info", "success"):
+        out.append(("leaf", f'<div class="md alert {kind}">{html.escape(node.value)}</div>'))
+    elif kind == "imgs":
+        for img in node.proto.imgs:
+            caption = f"<figcaption>{html.escape(img.caption)}</figcaption>" if img.caption else ""
+            out.append(("leaf", f'<figure><img src="{_media_url(img.url, assets)}" alt="{html.escape(img.caption)}">{caption}</figure>'))
+    elif kind == "audio":
+        out.append(("leaf", f'<audio controls src="{_media_url(node.proto.url, assets)}"></audio>'))
+    elif kind == "plotly_chart":
+        spec = assets.add(node.proto.spec, ".json")
+        out.append(("leaf", f'<div class="plotly" data-spec="{spec}"></div>'))
+    elif kind in ("slider", "select_slider", "number_input", "selectbox", "radio", "multiselect", "toggle", "checkbox", "text_input"):
+        out.append(("widget", _widget(node, live_url)))
+    # Buttons, download buttons and empty placeholders have no static form
+
+
+def render(page_id, sweep=None, values=(), live_url=""):
+    """Leaves at the defaults (``sweep`` None) or one leaf list per slider value."""
+    from streamlit.testing.v1 import AppTest
+
+    _media.clear()
+    at = AppTest.from_function(_page_app, args=(page_id,), default_timeout=TIMEOUT).run()
+    if sweep is None:
+        assets = Assets()
+        out = []
+        _leaves(at.main, assets, live_url, out)
+        # The slider's range, for the ones this page sweeps
+        ranges = {
+            s.key: (s.min, s.max, s.step) for s in at.slider if s.key in SWEEPS.get(page_id, [])
+        }
+        return out, assets.files, ranges, [e.message for e in at.exception]
+    states, files, errors = [], {}, []
+    for value in values:
+        _media.clear()
+        at.slider(key=sweep).set_value(value).run()
+        assets = Assets()
+        out = []
+        _leaves(at.main, assets, live_url, out)
+        states.append((value, out))
+        files.update(assets.files)
+        errors += [e.message for e in at.exception]
+    return states, files, errors
+
+
+def _slider_html(key, label, values, default):
+    index = values.index(default)
+    return (
+        f'<p class="widget"><label>{html.escape(label)}: <b id="{key}-value">{default}</b><br>'
+        f'<input type="range" min="0" max="{len(values) - 1}" value="{index}" data-sweep="{key}"></label></p>'
+    )
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} · MathBook</title>
+<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.css">
+<script src="https://cdn.jsdelivr.net/npm/marked@12/marked.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/contrib/auto-render.min.js"></script>
+{plotly}<link rel="stylesheet" href="site.css">
+</head><body>
+<nav>{nav}</nav>
+<main>
+{body}
+</main>
+<script id="sweeps" type="application/json">{sweeps}</script>
+<script src="site.js"></script>
+</body></html>
+"""
+
+SITE_CSS = """body { display: flex; margin: 0; font-family: "Source Sans Pro", sans-serif; color: #31333f; }
+nav { width: 15rem; padding: 2rem 1rem; background: #f0f2f6; min-height: 100vh; flex-shrink: 0; }
+nav a { display: block; padding: .3rem 0; color: #31333f; text-decoration: none; }
+nav a.current { font-weight: bold; }
+main { max-width: 46rem; padding: 2rem 3rem; flex-grow: 1; }
+img { max-width: 100%; }
+figure { margin: 1rem 0; }
+details { border: 1px solid #e6e9ef; border-radius: .5rem; padding: .5rem 1rem; margin: 1rem 0; }
+summary { cursor: pointer; }
+.widget { color: #555; }
+.widget input[type=range] { width: 100%; }
+.alert { padding: .5rem 1rem; border-radius: .5rem; background: #f0f2f6; }
+.plotly { min-height: 450px; }
+"""
+
+SITE_JS = """const MATH = [["$$", "$$", true], ["\\\\[", "\\\\]", true], ["\\\\(", "\\\\)", false], ["$", "$", false]];
+
+function renderMarkdown(root) {
+  root.querySelectorAll(".md").forEach((el) => {
+    // Keep math away from marked, which would eat the backslashes
+    const math = [];
+    const source = el.textContent.replace(/\\$\\$[\\s\\S]+?\\$\\$|\\\\\\[[\\s\\S]+?\\\\\\]|\\\\\\([\\s\\S]+?\\\\\\)/g, (m) => {
+      math.push(m);
+      return "@@MATH" + (math.length - 1) + "@@";
+    });
+    const escape = (s) => s.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+    el.innerHTML = marked.parse(source).replace(/@@MATH(\\d+)@@/g, (m, i) => escape(math[i]));
+    el.classList.remove("md");
+    renderMathInElement(el, { delimiters: MATH.map(([left, right, display]) => ({ left, right, display })) });
+  });
+  root.querySelectorAll(".plotly").forEach((el) => {
+    fetch(el.dataset.spec).then((r) => r.json()).then((fig) => Plotly.newPlot(el, fig.data, fig.layout, { responsive: true }));
+    el.classList.remove("plotly");
+  });
+}
+
+const sweeps = JSON.parse(document.getElementById("sweeps").textContent);
+document.querySelectorAll("input[data-sweep]").forEach((input) => {
+  const sweep = sweeps[input.dataset.sweep];
+  input.addEventListener("input", () => {
+    const state = sweep.states[input.value];
+    document.getElementById(input.dataset.sweep + "-value").textContent = sweep.values[input.value];
+    for (const [id, leaf] of Object.entries(state)) {
+      const el = document.getElementById(id);
+      el.innerHTML = leaf;
+      renderMarkdown(el);
+    }
+  });
+});
+renderMarkdown(document);
+"""
+
+
+def build_page(page, default, sweeps, nav):
+    """Assemble one page: default leaves, with swept leaves swapped per slider value."""
+    body, variants, has_plotly = [], {}, False
+    leaves = [html_ for kind, html_ in default if kind == "leaf"]
+    for key, states in sweeps.items():
+        values = [value for value, _ in states]
+        per_value = []
+        for value, out in states:
+            swept = [html_ for kind, html_ in out if kind == "leaf"]
+            if len(swept) != len(leaves):
+                raise RuntimeError(f"{page.id}: {key}={value} changes the page layout, which a static sweep can't express")
+            per_value.append(swept)
+        # A leaf is swept if it differs from the default at any value
+        changing = [i for i in range(len(leaves)) if any(state[i] != leaves[i] for state in per_value)]
+        variants[key] = {
+            "values": values,
+            "changing": changing,
+            "states": [{f"leaf-{i}": state[i] for i in changing} for state in per_value],
+        }
+
+    swept_leaves = {i for v in variants.values() for i in v["changing"]}
+    leaf_index = 0
+    for kind, content in default:
+        if kind == "leaf":
+            has_plotly |= 'class="plotly"' in content
+            if leaf_index in swept_leaves:
+                content = f'<div id="leaf-{leaf_index}">{content}</div>'
+            leaf_index += 1
+            body.append(content)
+        elif kind == "widget":
+            if content["key"] in variants:
+                body.append(_slider_html(content["key"], content["label"], variants[content["key"]]["values"], content["value"]))
+            else:
+                body.append(content["html"])
+        else:
+            body.append(content)
+    has_plotly |= any("plotly" in leaf for v in variants.values() for state in v["states"] for leaf in state.values())
+    sweeps_json = {key: {"values": v["values"], "states": v["states"]} for key, v in variants.items()}
+    return PAGE_TEMPLATE.format(
+        title=html.escape(page.label),
+        plotly='<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>\n' if has_plotly else "",
+        nav=nav(page.id),
+        body="\n".join(body),
+        sweeps=json.dumps(sweeps_json).replace("</", "<\\/"),
+    )
+
+
+def _values(lo, hi, step):
+    count = int(round((hi - lo) / step)) + 1
+    return [lo + i * step for i in range(count)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default=os.path.join(ROOT, "site"))
+    parser.add_argument("-k", default="", help="only pages whose id contains this (case-insensitive)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--live-url", default="", help="where the interactive app runs, linked from unswept widgets")
+    args = parser.parse_args(argv)
+
+    pages = [p for p in PAGES if p.id not in LIVE_ONLY and args.k.lower() in p.id.lower()]
+    if not pages:
+        parser.error(f"no pages match -k {args.k!r}")
+    assets_dir = os.path.join(args.output, "assets")
+    os.makedirs(assets_dir, exist_ok=True)
+    started = time.perf_counter()
+    written = set(os.listdir(assets_dir))
+
+    def write_assets(files):
+        for name, data in files.items():
+            if name not in written:
+                with open(os.path.join(assets_dir, name), "wb") as f:
+                    f.write(data)
+                written.add(name)
+
+    with workers.process_pool(args.workers) as pool:
+        defaults = {p.id: pool.submit(render, p.id, live_url=args.live_url) for p in pages}
+        chunks, results, errors = {}, {}, []
+        for p in pages:
+            default, files, ranges, page_errors = defaults[p.id].result()
+            write_assets(files)
+            errors += [f"{p.id}: {e}" for e in page_errors]
+            results[p.id] = (default, ranges)
+            for key in SWEEPS.get(p.id, []):
+                values = _values(*ranges[key])
+                chunks[p.id, key] = [
+                    pool.submit(render, p.id, key, values[i:i + CHUNK], args.live_url)
+                    for i in range(0, len(values), CHUNK)
+                ]
+
+        def nav(current):
+            links = [
+                f'<a href="{slug(p.id)}.html"{" class=current" if p.id == current else ""}>{html.escape(p.button_label)}</a>'
+                for p in pages
+            ]
+            if args.live_url:
+                links.append(f'<a href="{html.escape(args.live_url)}">🧮 Live app (calculators, quizzes)</a>')
+            return "\n".join(links)
+
+        states = 0
+        for p in pages:
+            default, ranges = results[p.id]
+            sweeps = {}
+            for key in SWEEPS.get(p.id, []):
+                sweeps[key] = []
+                for future in chunks[p.id, key]:
+                    chunk_states, files, chunk_errors = future.result()
+                    write_assets(files)
+                    errors += [f"{p.id} {key}: {e}" for e in chunk_errors]
+                    sweeps[key] += chunk_states
+                states += len(sweeps[key])
+            with open(os.path.join(args.output, f"{slug(p.id)}.html"), "w", encoding="utf-8") as f:
+                f.write(build_page(p, default, sweeps, nav))
+            print(f"{p.id:28s} {1 + sum(len(s) for s in sweeps.values()):4d} states")
+
+    for name, content in (("site.css", SITE_CSS), ("site.js", SITE_JS)):
+        with open(os.path.join(args.output, name), "w", encoding="utf-8") as f:
+            f.write(content)
+    with open(os.path.join(args.output, "index.html"), "w", encoding="utf-8") as f:
+        f.write(f'<!DOCTYPE html><meta charset="utf-8"><meta http-equiv="refresh" content="0; url={slug(pages[0].id)}.html">')
+
+    size = sum(os.path.getsize(os.path.join(assets_dir, name)) for name in written)
+    print(f"{len(pages)} pages, {len(pages) + states} states, {len(written)} assets ({size / 1e6:.1f} MB) "
+          f"in {time.perf_counter() - started:.0f} s -> {args.output}")
+    for message in errors:
+        print("EXCEPTION", message[:300], file=sys.stderr)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # Run from the importable module rather than __main__: AppTest swaps out
+    # sys.modules["__main__"] in the workers, and the AppTest script reaches
+    # _media through tools.export_site
+    from tools import export_site
+
+    export_site.main()
@@ -0,0 +1,251 @@
+"""Measure what the first request costs, in fresh interpreters.
+
+    python tools/profile_startup.py                        # app.py and app_singlepage.py
+    python tools/profile_startup.py app.py --no-pages      # just the entry point's cold start
+    python tools/profile_startup.py --json startup.json    # also write a machine-readable report
+    python tools/profile_startup.py --compare startup.json # exit non-zero on regressions
+    python tools/profile_startup.py --cold-font-cache      # make matplotlib rebuild its font cache
+
+Each entry point is cold-started under ``python -X importtime``: streamlit
+import, first paint, and every module imported on the way with its own
+(self) import time, grouped by package (``mathbook.*`` and ``pages.*``
+modules are kept apart). Then every page the entry point offers is opened
+from a cold start of its own, so a page is charged for everything it
+imports first (matplotlib and its font manager, plotly, PIL, reportlab,
+...) regardless of the order students happen to click in. Page time is
+split into the page module import and the first call of its show
+function.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mathbook.registry import APP_PAGES, SINGLEPAGE_PAGES  # noqa: E402
+
+HEAVY_MODULES = ["matplotlib", "matplotlib.font_manager", "numpy", "plotly", "PIL", "reportlab"]
+ENTRY_POINTS = ["app.py", "app_singlepage.py"]
+
+# (session state that opens the page, page id) for the pages each entry point
+# offers. The state is set before the first run, so the page is the first
+# thing drawn, not whatever the entry point shows by default.
+NAVIGATION = {
+    "app.py": [
+        ({"category": "Geometry"} if page.category == "Geometry"
+         else {"category": "Trigonometry", "trig_page": page.id}, page.id)
+        for page in APP_PAGES
+    ],
+    "app_singlepage.py": [({"page": page.id}, page.id) for page in SINGLEPAGE_PAGES],
+}
+
+# Differences smaller than this are noise, whatever the ratio
+MIN_REGRESSION_MS = 50.0
+TOP_IMPORTS = 15
+
+# Runs inside the child interpreter so nothing is warm. Phase markers go to
+# stderr so the -X importtime lines there can be split by phase.
+_CHILD = """
+import json, sys, time
+
+def phase(name):
+    sys.stderr.write("@@phase " + name + "\\n")
+    sys.stderr.flush()
+
+phase("streamlit")
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+
+phase("tooling")
+from mathbook import registry
+pages = {}
+_load_page, _show = registry.load_page, registry.Page.show
+
+def load_page(page):
+    start = time.perf_counter()
+    try:
+        return _load_page(page)
+    finally:
+        pages.setdefault(page.id, {})["import_ms"] = (time.perf_counter() - start) * 1000
+
+def show(self):
+    start = time.perf_counter()
+    try:
+        return _show(self)
+    finally:
+        timing = pages.setdefault(self.id, {})
+        timing["total_ms"] = (time.perf_counter() - start) * 1000
+        timing["show_ms"] = timing["total_ms"] - timing.get("import_ms", 0.0)
+
+registry.load_page, registry.Page.show = load_page, show
+
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+state = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {}
+for key, value in state.items():
+    at.session_state[key] = value
+phase("page" if state else "first_paint")
+t2 = time.perf_counter()
+at.run()
+t3 = time.perf_counter()
+result = {
+    "streamlit_import_ms": (t1 - t0) * 1000,
+    "first_paint_ms": (t3 - t2) * 1000,
+    "cold_start_ms": (t1 - t0 + t3 - t2) * 1000,
+    "first_paint_pages": dict(pages),
+    "exceptions": [e.message for e in at.exception],
+}
+if state:
+    result["page"] = dict(next(iter(pages.values()), {}), first_render_ms=(t3 - t2) * 1000)
+phase("done")
+print(json.dumps(result))
+"""
+
+
+def _group(module):
+    if module.startswith(("mathbook.", "pages.")):
+        return module
+    return module.split(".")[0]
+
+
+def parse_importtime(stderr):
+    """Self import time by package and cumulative time of the heavy modules, per phase."""
+    phases, current = {}, None
+    for line in stderr.splitlines():
+        if line.startswith("@@phase "):
+            current = phases.setdefault(line.split(None, 1)[1], {"by_package": {}, "heavy": {}, "total_ms": 0.0})
+            continue
+        if current is None or not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        self_ms = int(self_us) / 1000
+        group = _group(module)
+        current["by_package"][group] = current["by_package"].get(group, 0.0) + self_ms
+        current["total_ms"] += self_ms
+        if module in HEAVY_MODULES:
+            current["heavy"][module] = int(cumulative_us) / 1000
+    for phase in phases.values():
+        top = sorted(phase["by_package"].items(), key=lambda item: -item[1])[:TOP_IMPORTS]
+        phase["by_package"] = {name: round(ms, 2) for name, ms in top}
+        phase["total_ms"] = round(phase["total_ms"], 2)
+    return phases
+
+
+def run_child(script, state=None, cold_font_cache=False):
+    env = dict(os.environ, PYTHONPATH=ROOT, MATHBOOK_WARM_FRAMES="0",
+               MATHBOOK_RENDER_WORKERS="0", MATHBOOK_TRACE="0")
+    with tempfile.TemporaryDirectory() as mpl_dir:
+        if cold_font_cache:
+            env["MPLCONFIGDIR"] = mpl_dir
+        out = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _CHILD, script, *([json.dumps(state)] if state else [])],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result["imports"] = parse_importtime(out.stderr)
+    return result
+
+
+def measure(script, pages=True, cold_font_cache=False):
+    cold = run_child(script, cold_font_cache=cold_font_cache)
+    report = {
+        "cold_start_ms": cold["cold_start_ms"],
+        "streamlit_import_ms": cold["streamlit_import_ms"],
+        "first_paint_ms": cold["first_paint_ms"],
+        "imports": {phase: cold["imports"][phase] for phase in ("streamlit", "first_paint") if phase in cold["imports"]},
+        "exceptions": cold["exceptions"],
+        "pages": {},
+    }
+    # A page drawn as part of first paint is already covered by it
+    for page_id, timing in cold["first_paint_pages"].items():
+        report["pages"][page_id] = dict(timing, first_render_ms=timing.get("total_ms", 0.0), in_first_paint=True)
+    if pages:
+        for state, page_id in NAVIGATION.get(os.path.basename(script), []):
+            if page_id in report["pages"]:
+                continue
+            child = run_child(script, state, cold_font_cache)
+            report["pages"][page_id] = dict(child.get("page", {}), imports=child["imports"].get("page"))
+            report["exceptions"] += child["exceptions"]
+    return report
+
+
+def compare(report, baseline, tolerance):
+    regressions = []
+
+    def check(name, value, base):
+        if base is not None and value > base * (1 + tolerance) and value - base > MIN_REGRESSION_MS:
+            regressions.append(f"{name}: {value:.0f} ms > baseline {base:.0f} ms (+{tolerance:.0%})")
+
+    for script, entry in report["entry_points"].items():
+        base = baseline.get("entry_points", {}).get(script)
+        if base is None:
+            continue
+        for metric in ("cold_start_ms", "first_paint_ms"):
+            check(f"{script} {metric}", entry[metric], base.get(metric))
+        for page_id, page in entry["pages"].items():
+            check(f"{script} page {page_id}", page["first_render_ms"], base["pages"].get(page_id, {}).get("first_render_ms"))
+    return regressions
+
+
+def _print(script, entry):
+    print(f"{script}: cold start {entry['cold_start_ms']:.0f} ms "
+          f"(streamlit import {entry['streamlit_import_ms']:.0f} ms, first paint {entry['first_paint_ms']:.0f} ms)")
+    first_paint = entry["imports"].get("first_paint", {})
+    for name, ms in list(first_paint.get("by_package", {}).items())[:8]:
+        print(f"    import {name:40s} {ms:8.1f} ms")
+    for page_id, page in sorted(entry["pages"].items(), key=lambda item: -item[1].get("first_render_ms", 0)):
+        heavy = (page.get("imports") or {}).get("heavy", {})
+        loaded = ", ".join(f"{name} {ms:.0f}" for name, ms in heavy.items())
+        print(f"  {page_id:28s} first render {page.get('first_render_ms', 0):7.0f} ms | "
+              f"import {page.get('import_ms', 0):6.0f} ms | show {page.get('show_ms', 0):6.0f} ms"
+              + (f" | {loaded}" if loaded else ""))
+    for message in entry["exceptions"]:
+        print("  EXCEPTION", message[:200])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="*", default=ENTRY_POINTS)
+    parser.add_argument("--no-pages", action="store_true", help="only cold-start the entry points")
+    parser.add_argument("--cold-font-cache", action="store_true", help="give every child an empty MPLCONFIGDIR")
+    parser.add_argument("--json", metavar="PATH", help="write the report here ('-' for stdout)")
+    parser.add_argument("--compare", metavar="PATH", help="baseline report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cold_font_cache": args.cold_font_cache,
+        "entry_points": {},
+    }
+    for script in args.scripts:
+        entry = measure(script, pages=not args.no_pages, cold_font_cache=args.cold_font_cache)
+        report["entry_points"][script] = entry
+        if args.json != "-":
+            _print(script, entry)
+
+    if args.json == "-":
+        print(json.dumps(report, indent=2))
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()